@@ -22,10 +22,15 @@
 
 import os
 import sys
+from typing import TYPE_CHECKING, Any
 
-# Version from package metadata
-from importlib.metadata import version as _get_version
-__version__ = _get_version("rationalbloks-mcp")
+# API key format - shared with core.auth, dependency-free so bad keys fail
+# before any heavy import
+from ._keys import API_KEY_PREFIX, API_KEY_MIN_LENGTH
+
+# Version - single source of truth (pyproject.toml reads it via hatch)
+# Static literal: no importlib.metadata scan of site-packages at startup
+__version__ = "0.10.2"
 
 # Public API
 __all__ = [
@@ -37,10 +42,46 @@ __all__ = [
     "INFRASTRUCTURE_TOOLS",
 ]
 
-# Re-export for convenience
-from .backend.tools import (
-    BACKEND_TOOLS, GRAPH_TOOLS, GRAPH_DATA_TOOLS,
-    INFRASTRUCTURE_TOOLS,
+# Re-export for convenience (resolved lazily - see __getattr__ below)
+if TYPE_CHECKING:
+    from .backend.tools import (
+        BACKEND_TOOLS, GRAPH_TOOLS, GRAPH_DATA_TOOLS,
+        INFRASTRUCTURE_TOOLS,
+    )
+
+# Names served from backend.tools on first access
+_LAZY_TOOL_EXPORTS = frozenset({
+    "BACKEND_TOOLS",
+    "GRAPH_TOOLS",
+    "GRAPH_DATA_TOOLS",
+    "INFRASTRUCTURE_TOOLS",
+})
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562 lazy re-exports
+    # Importing backend.tools pulls in mcp, httpx and starlette - only pay
+    # for that when a tool list is actually requested, not on every import
+    if name in _LAZY_TOOL_EXPORTS:
+        from .backend import tools
+        value = getattr(tools, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Startup error messages - one pre-joined write each, stdout stays JSON-RPC only
+_API_KEY_MISSING_MSG = (
+    "ERROR: RATIONALBLOKS_API_KEY environment variable not set\n"
+    "\n"
+    "Get your API key from: https://rationalbloks.com/settings\n"
+    "\n"
+    "Then set it:\n"
+    "  export RATIONALBLOKS_API_KEY=rb_sk_your_key_here\n"
+)
+_API_KEY_FORMAT_MSG = (
+    "ERROR: Invalid API key format. Must start with 'rb_sk_' "
+    f"and be at least {API_KEY_MIN_LENGTH} characters long\n"
 )
 
 
@@ -55,16 +96,14 @@ def _validate_api_key(api_key: str | None, transport: str) -> str | None:
     
     # STDIO mode: API key required at startup
     if not api_key:
-        print("ERROR: RATIONALBLOKS_API_KEY environment variable not set", file=sys.stderr)
-        print("", file=sys.stderr)
-        print("Get your API key from: https://rationalbloks.com/settings", file=sys.stderr)
-        print("", file=sys.stderr)
-        print("Then set it:", file=sys.stderr)
-        print("  export RATIONALBLOKS_API_KEY=rb_sk_your_key_here", file=sys.stderr)
+        sys.stderr.write(_API_KEY_MISSING_MSG)
+        sys.stderr.flush()
         sys.exit(1)
     
-    if not api_key.startswith("rb_sk_"):
-        print("ERROR: Invalid API key format. Must start with 'rb_sk_'", file=sys.stderr)
+    # Cheap length check first, prefix compare only for plausible keys
+    if len(api_key) < API_KEY_MIN_LENGTH or not api_key.startswith(API_KEY_PREFIX):
+        sys.stderr.write(_API_KEY_FORMAT_MSG)
+        sys.stderr.flush()
         sys.exit(1)
     
     return api_key
@@ -74,22 +113,35 @@ def main() -> None:
     # Main entry point - runs the backend MCP server
     api_key = os.environ.get("RATIONALBLOKS_API_KEY")
     transport = os.environ.get("TRANSPORT", "stdio").lower()
-    http_mode = transport == "http"
     
     # Validate API key
     validated_key = _validate_api_key(api_key, transport)
     
-    print(f"[rationalbloks-mcp] Starting server (44 tools: 18 relational + 11 graph schema + 15 graph data)...", file=sys.stderr)
-    
     try:
         from .backend import create_backend_server
-        server = create_backend_server(api_key=validated_key, http_mode=http_mode)
-        server.run(transport=transport)
+        from .backend.tools import BACKEND_TOOLS, GRAPH_TOOLS, GRAPH_DATA_TOOLS
+        server = create_backend_server(api_key=validated_key, transport=transport)
+        
+        # Banner only once the server is built - a failed import or invalid
+        # key never leaves a misleading "Starting" line behind (one write)
+        sys.stderr.write(
+            f"[rationalbloks-mcp] Starting server v{__version__} "
+            f"(transport={transport}, api_key={'set' if validated_key else 'per-request'}, "
+            f"{len(BACKEND_TOOLS) + len(GRAPH_TOOLS) + len(GRAPH_DATA_TOOLS)} tools: "
+            f"{len(BACKEND_TOOLS)} relational + {len(GRAPH_TOOLS)} graph schema + "
+            f"{len(GRAPH_DATA_TOOLS)} graph data)...\n"
+        )
+        sys.stderr.flush()
+        server.run()
         
     except KeyboardInterrupt:
         sys.exit(0)
-    except Exception as e:
-        print(f"ERROR: {e}", file=sys.stderr)
+    except (OSError, ValueError, RuntimeError) as e:
+        # Expected startup failures (bad key, port in use, event loop errors)
+        # Anything else is a bug - let it surface with a full traceback
+        # Diagnostics go to stderr only: stdout carries the STDIO JSON-RPC stream
+        sys.stderr.write("ERROR: " + str(e) + "\n")
+        sys.stderr.flush()
         sys.exit(1)
 
 
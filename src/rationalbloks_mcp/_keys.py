@@ -0,0 +1,25 @@
+# ============================================================================
+# RATIONALBLOKS MCP - API KEY FORMAT
+# ============================================================================
+# Copyright 2026 RationalBloks. All Rights Reserved.
+#
+# Single definition of the API key format, shared by the entry point's
+# startup check and core.auth's per-request validation.
+# Dependency-free on purpose: the entry point imports it before any of the
+# heavy MCP/HTTP stack is loaded.
+#
+# No upper length bound - the gateway owns the key format and may issue
+# longer keys; oversized HTTP headers are already capped by the server.
+# ============================================================================
+
+# Public API
+__all__ = [
+    "API_KEY_PREFIX",
+    "API_KEY_MIN_LENGTH",
+]
+
+# API key prefix - all RationalBloks keys start with this
+API_KEY_PREFIX = "rb_sk_"
+
+# Prefix + at least 20 chars
+API_KEY_MIN_LENGTH = len(API_KEY_PREFIX) + 20
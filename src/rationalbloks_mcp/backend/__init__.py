@@ -9,15 +9,19 @@
 # - Graph Data: 15 tools (node/relationship CRUD, search, traverse, bulk)
 # ============================================================================
 
-from .client import LogicBlokClient
-from .tools import (
-    BACKEND_TOOLS,
-    GRAPH_TOOLS,
-    GRAPH_DATA_TOOLS,
-    INFRASTRUCTURE_TOOLS,
-    BackendMCPServer,
-    create_backend_server,
-)
+from typing import TYPE_CHECKING, Any
+
+# Submodules load on first attribute access (see __getattr__ below)
+if TYPE_CHECKING:
+    from .client import LogicBlokClient
+    from .tools import (
+        BACKEND_TOOLS,
+        GRAPH_TOOLS,
+        GRAPH_DATA_TOOLS,
+        INFRASTRUCTURE_TOOLS,
+        BackendMCPServer,
+        create_backend_server,
+    )
 
 __all__ = [
     "LogicBlokClient",
@@ -28,3 +32,26 @@ __all__ = [
     "BackendMCPServer",
     "create_backend_server",
 ]
+
+# Public name -> submodule that defines it
+_LAZY_EXPORTS = {
+    "LogicBlokClient": "client",
+    "BACKEND_TOOLS": "tools",
+    "GRAPH_TOOLS": "tools",
+    "GRAPH_DATA_TOOLS": "tools",
+    "INFRASTRUCTURE_TOOLS": "tools",
+    "BackendMCPServer": "tools",
+    "create_backend_server": "tools",
+}
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562 lazy exports - importing the package (or just .client) does
+    # not drag in the tool tables, prompts and MCP server stack
+    submodule = _LAZY_EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f".{submodule}", __name__), name)
+    globals()[name] = value
+    return value
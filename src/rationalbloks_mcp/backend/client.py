@@ -7,16 +7,67 @@
 # Uses the /api/mcp/execute endpoint with tool name + arguments pattern.
 # ============================================================================
 
+import asyncio
 import httpx
+import json
+import math
 import os
+import random
+import re
 import ssl
+import urllib.request
 import certifi
-import json
+import orjson
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
 from typing import Any
 
 # Public API
 __all__ = ["LogicBlokClient"]
 
+# Shared TLS context - parsing the certifi CA bundle is the expensive part,
+# and the context is immutable once built, so every client reuses this one.
+# certifi (not the system store) fixes issues in isolated uvx environments.
+_SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+
+# Connection pool limits. Tool calls are sporadic (an agent thinks between
+# calls), so idle connections are kept for 120s instead of httpx's 5s
+# default - otherwise most calls would pay a fresh TCP + TLS handshake.
+_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=120.0,
+)
+
+# Request bodies for argument-less calls (list_projects, get_user_info, ...)
+# depend only on the tool name, so each is encoded once and reused. The tool
+# catalog keeps this small; the cap guards direct callers of execute().
+_EMPTY_ARGS_BODIES: dict[str, bytes] = {}
+_EMPTY_ARGS_BODIES_MAX = 256
+
+
+def _encode_body(payload: dict) -> bytes:
+    # orjson encodes straight to bytes (httpx's json= uses stdlib json), but
+    # it rejects integers wider than 64 bits - free-form user data may carry
+    # those, and stdlib json sends them exactly
+    try:
+        return orjson.dumps(payload)
+    except orjson.JSONEncodeError:
+        return json.dumps(payload).encode()
+
+
+# orjson parses integers beyond the 64-bit range as floats, silently losing
+# digits (gateway ids, user numbers). Any such literal needs at least 19
+# digits in a row - bodies containing one are parsed with stdlib json, which
+# keeps them exact. The scan is a single C pass over the bytes.
+_WIDE_NUMBER = re.compile(rb"\d{19}")
+
+
+def _decode_body(content: bytes) -> Any:
+    if _WIDE_NUMBER.search(content):
+        return json.loads(content)
+    return orjson.loads(content)
+
 
 class LogicBlokClient:
     # HTTP client for LogicBlok MCP Gateway
@@ -27,21 +78,63 @@ class LogicBlokClient:
     # Falls back to the public ingress for local / STDIO / dev use.
     BASE_URL = os.environ.get("LOGICBLOK_URL", "https://logicblok.rationalbloks.com")
     
-    def __init__(self, api_key: str) -> None:
+    # 429/503 retry policy: the server's Retry-After when given, otherwise
+    # capped exponential backoff with full jitter, so clients that failed
+    # together do not all retry in lockstep.
+    # A 503 does not prove the gateway did nothing, so non-idempotent calls
+    # only retry on 429 or a 503 that carries Retry-After (explicit shedding)
+    RETRY_STATUSES = frozenset({429, 503})
+    MAX_RETRIES = 3
+    # Failed TCP/TLS connects are retried inside the httpx transport
+    # (nothing was sent yet, so this is safe for every tool)
+    CONNECT_RETRIES = 2
+    RETRY_DELAY = 1.0
+    MAX_RETRY_DELAY = 30.0
+    
+    def __init__(self, api_key: str, http_client: httpx.AsyncClient | None = None) -> None:
         # Initialize client with API key (rb_sk_...)
+        # http_client: shared connection pool (see create_http_client) - the
+        # caller owns it and closes it. Without one, the client owns its pool.
         self.api_key = api_key
-        # Use certifi for SSL certs (fixes issues in isolated uvx environments)
-        ssl_context = ssl.create_default_context(cafile=certifi.where())
-        self._client = httpx.AsyncClient(
-            base_url=self.BASE_URL,
-            headers={"Authorization": f"Bearer {api_key}"},
+        # Auth goes on each request, not the pool, so a pool can be shared
+        # across API keys (HPACK still compresses the repeated header)
+        self._request_headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        }
+        self._owns_client = http_client is None
+        self._client = http_client if http_client is not None else self.create_http_client()
+    
+    @classmethod
+    def create_http_client(cls) -> httpx.AsyncClient:
+        # Build an httpx pool for the gateway, shareable by any number of
+        # LogicBlokClient instances (one per API key)
+        # An explicit transport turns off httpx's own HTTPS_PROXY lookup, so
+        # resolve the proxy (honouring NO_PROXY) here to keep proxied setups working
+        url = httpx.URL(cls.BASE_URL)
+        proxy = None
+        if not urllib.request.proxy_bypass(url.host):
+            proxies = urllib.request.getproxies()
+            proxy = proxies.get(url.scheme) or proxies.get("all")
+        transport = httpx.AsyncHTTPTransport(
+            verify=_SSL_CONTEXT,
+            # HTTP/2 multiplexes concurrent tool calls over one TLS connection
+            # (negotiated via ALPN - falls back to HTTP/1.1 if unsupported)
+            http2=True,
+            limits=_POOL_LIMITS,
+            retries=cls.CONNECT_RETRIES,
+            proxy=proxy,
+        )
+        return httpx.AsyncClient(
+            base_url=cls.BASE_URL,
             timeout=60.0,  # Longer timeout for deployment operations
-            verify=ssl_context,
+            transport=transport,
         )
     
     async def close(self) -> None:
-        # Close the HTTP client
-        await self._client.aclose()
+        # Close the HTTP client (a shared pool is left to its owner)
+        if self._owns_client:
+            await self._client.aclose()
     
     async def __aenter__(self) -> "LogicBlokClient":
         return self
@@ -49,13 +142,72 @@ class LogicBlokClient:
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         await self.close()
     
-    async def _execute(self, tool: str, arguments: dict | None = None) -> Any:
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float | None:
+        # Seconds to wait before retrying, or None to give up now
+        # Retry-After may be delta-seconds or an HTTP-date (RFC 9110)
+        # Missing or unparseable header: full jitter, uniform in
+        # [0, capped exponential delay]
+        backoff = random.uniform(0, min(self.MAX_RETRY_DELAY, self.RETRY_DELAY * (2 ** attempt)))
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is None:
+            return backoff
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                return backoff
+            # A "-0000" zone parses as naive - RFC 5322 says that means UTC
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+        # nan/inf would make asyncio.sleep never return (or fail) - ignore them
+        if not math.isfinite(delay):
+            return backoff
+        # Waiting longer than the cap would stall the tool call - fail instead
+        if delay > self.MAX_RETRY_DELAY:
+            return None
+        return max(delay, 0.0)
+    
+    def _should_retry(self, response: httpx.Response, idempotent: bool) -> bool:
+        # Whether a failed call may be sent again (attempt budget aside)
+        if response.status_code not in self.RETRY_STATUSES:
+            return False
+        if idempotent or response.status_code == 429:
+            return True
+        return "Retry-After" in response.headers
+    
+    async def _execute(
+        self,
+        tool: str,
+        arguments: dict | None = None,
+        idempotent: bool = False,
+    ) -> Any:
         # Execute an MCP tool via the gateway
+        # idempotent: safe to resend on any 503 (read-only / idempotent tools)
         # All tools use POST /api/mcp/execute with {"tool": "...", "arguments": {...}}
-        payload = {"tool": tool, "arguments": arguments or {}}
-        response = await self._client.post("/api/mcp/execute", json=payload)
+        if arguments:
+            body = _encode_body({"tool": tool, "arguments": arguments})
+        else:
+            body = _EMPTY_ARGS_BODIES.get(tool)
+            if body is None:
+                body = orjson.dumps({"tool": tool, "arguments": {}})
+                if len(_EMPTY_ARGS_BODIES) < _EMPTY_ARGS_BODIES_MAX:
+                    _EMPTY_ARGS_BODIES[tool] = body
+        for attempt in range(self.MAX_RETRIES + 1):
+            response = await self._client.post(
+                "/api/mcp/execute", content=body, headers=self._request_headers
+            )
+            if attempt == self.MAX_RETRIES or not self._should_retry(response, idempotent):
+                break
+            delay = self._retry_delay(response, attempt)
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
         response.raise_for_status()
-        result = response.json()
+        # orjson parses the raw body bytes directly (no str decode, C parser)
+        result = _decode_body(response.content)
         
         # Gateway returns {"success": bool, "result": ..., "error": ...}
         if not result.get("success", False):
@@ -67,5 +219,10 @@ class LogicBlokClient:
     # Public alias -- preferred call path for the MCP tool dispatcher.
     # The dispatcher does not need per-tool wrappers; it passes the MCP tool
     # name straight through to the LogicBlok gateway.
-    async def execute(self, tool: str, arguments: dict | None = None) -> Any:
-        return await self._execute(tool, arguments)
+    async def execute(
+        self,
+        tool: str,
+        arguments: dict | None = None,
+        idempotent: bool = False,
+    ) -> Any:
+        return await self._execute(tool, arguments, idempotent)
@@ -0,0 +1,91 @@
+# ============================================================================
+# RATIONALBLOKS MCP - SCHEMA PRE-FLIGHT VALIDATION
+# ============================================================================
+# Copyright 2026 RationalBloks. All Rights Reserved.
+#
+# Local check of the FLAT schema rules documented in the tool descriptions.
+# A malformed schema otherwise only fails after the gateway has run a full
+# Docker build and Kubernetes deploy - minutes later.
+#
+# CHAIN MANTRA ENFORCEMENT:
+# - Only the hard MUST rules are checked - never reject a schema LogicBlok accepts
+# - LogicBlok remains the source of truth for everything else
+# - Reports every violation at once, not just the first
+# ============================================================================
+
+from typing import Any
+
+# Public API
+__all__ = [
+    "SCHEMA_TOOLS",
+    "find_schema_violations",
+    "find_schema_warnings",
+    "validate_flat_schema",
+]
+
+# Tools whose "schema" argument is checked before the gateway call
+SCHEMA_TOOLS = frozenset({"create_project", "update_schema"})
+
+# Documented DON'Ts that are advisory only (never used to reject a schema)
+_AUTOMATIC_FIELDS = frozenset({"id", "created_at", "updated_at"})
+_AUTH_TABLES = frozenset({"users", "customers", "employees", "members"})
+
+
+def find_schema_violations(schema: Any) -> list[str]:
+    # Check a relational schema against the documented FLAT format rules
+    # Returns: One human-readable message per violation (empty if valid)
+    if not isinstance(schema, dict):
+        return ["schema must be an object mapping table names to fields"]
+    
+    violations = []
+    for table, fields in schema.items():
+        if not isinstance(fields, dict):
+            violations.append(f"{table}: table must map field names to field definitions")
+            continue
+        nested = fields.get("fields")
+        if isinstance(nested, dict) and "type" not in nested:
+            violations.append(
+                f"{table}: fields are nested under 'fields' - use FLAT format "
+                "(table_name → field_name → properties)"
+            )
+            continue
+        for field, props in fields.items():
+            where = f"{table}.{field}"
+            if not isinstance(props, dict) or "type" not in props:
+                violations.append(f"{where}: missing 'type' property")
+                continue
+            field_type = props["type"]
+            if field_type == "string" and "max_length" not in props:
+                violations.append(f"{where}: string fields MUST have max_length")
+            elif field_type == "decimal" and ("precision" not in props or "scale" not in props):
+                violations.append(f"{where}: decimal fields MUST have precision and scale")
+            elif field_type == "timestamp":
+                violations.append(f"{where}: use 'datetime' instead of 'timestamp'")
+    return violations
+
+
+def find_schema_warnings(schema: Any) -> list[str]:
+    # Check the advisory rules: automatic fields and user/auth tables
+    # Returns: One human-readable message per finding (empty if none)
+    if not isinstance(schema, dict):
+        return []
+    
+    warnings = []
+    for table, fields in schema.items():
+        if table in _AUTH_TABLES:
+            warnings.append(f"{table}: use the built-in app_users table with a user_id foreign key")
+        if not isinstance(fields, dict):
+            continue
+        for field in fields:
+            if field in _AUTOMATIC_FIELDS:
+                warnings.append(f"{table}.{field}: automatic field - do not define it")
+    return warnings
+
+
+def validate_flat_schema(schema: Any) -> None:
+    # Raise ValueError listing every violation, before any gateway round-trip
+    violations = find_schema_violations(schema)
+    if violations:
+        raise ValueError(
+            "Schema validation failed:\n" + "\n".join(f"- {v}" for v in violations)
+        )
@@ -30,13 +30,21 @@
 #              bulk_create_graph_nodes, bulk_create_graph_relationships
 # ============================================================================
 
+from collections import OrderedDict
 from typing import Any
 
+import orjson
 from mcp.types import Prompt, PromptArgument, PromptMessage, GetPromptResult, TextContent
 
 from .. import __version__
-from ..core import BaseMCPServer
+from ..core import BaseMCPServer, ResponseCache
 from .client import LogicBlokClient
+from .schema_validate import (
+    SCHEMA_TOOLS,
+    find_schema_violations,
+    find_schema_warnings,
+    validate_flat_schema,
+)
 
 # Public API
 __all__ = [
@@ -46,6 +54,7 @@ __all__ = [
     "INFRASTRUCTURE_TOOLS",
     "BACKEND_PROMPTS",
     "GRAPH_PROMPTS",
+    "INFRASTRUCTURE_PROMPTS",
     "BackendMCPServer",
     "create_backend_server",
 ]
@@ -55,54 +64,58 @@ __all__ = [
 # TOOL DEFINITIONS
 # ============================================================================
 
+# Shared fragments - referenced, never copied, by the tool definitions below.
+# Treated as read-only: nothing downstream mutates tool definitions.
+_EMPTY_INPUT_SCHEMA = {"type": "object", "properties": {}, "required": []}
+_PROJECT_ID_PROPERTY = {"type": "string", "description": "Project ID (UUID)"}
+_PROJECT_ID_INPUT_SCHEMA = {
+    "type": "object",
+    "properties": {"project_id": _PROJECT_ID_PROPERTY},
+    "required": ["project_id"],
+}
+
+_READ_ONLY_ANNOTATIONS = {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+_WRITE_ANNOTATIONS = {"readOnlyHint": False, "destructiveHint": False, "idempotentHint": False, "openWorldHint": True}
+_IDEMPOTENT_WRITE_ANNOTATIONS = {"readOnlyHint": False, "destructiveHint": False, "idempotentHint": True, "openWorldHint": True}
+_IDEMPOTENT_LOCAL_WRITE_ANNOTATIONS = {"readOnlyHint": False, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+_DESTRUCTIVE_ANNOTATIONS = {"readOnlyHint": False, "destructiveHint": True, "idempotentHint": False, "openWorldHint": True}
+
 BACKEND_TOOLS = [
     # --- READ OPERATIONS ---
     {
         "name": "list_projects",
         "title": "List Projects",
         "description": "List all your RationalBloks projects with their status and URLs",
-        "inputSchema": {"type": "object", "properties": {}, "required": []},
-        "annotations": {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+        "inputSchema": _EMPTY_INPUT_SCHEMA,
+        "annotations": _READ_ONLY_ANNOTATIONS
     },
     {
         "name": "get_project",
         "title": "Get Project Details",
         "description": "Get detailed information about a specific project",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"}
-            },
-            "required": ["project_id"]
-        },
-        "annotations": {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+        "inputSchema": _PROJECT_ID_INPUT_SCHEMA,
+        "annotations": _READ_ONLY_ANNOTATIONS
     },
     {
         "name": "get_schema",
         "title": "Get Project Schema",
         "description": "Get the JSON schema definition of a project in FLAT format. Returns the schema structure where each table name maps directly to field definitions. This is the same format required for create_project and update_schema. USE CASES: Review current schema before making updates, copy schema as template for new projects, verify schema structure after deployment, learn the correct schema format by example. The returned schema will be in FLAT format: {table_name: {field_name: {type, properties}}}",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"}
-            },
-            "required": ["project_id"]
-        },
-        "annotations": {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+        "inputSchema": _PROJECT_ID_INPUT_SCHEMA,
+        "annotations": _READ_ONLY_ANNOTATIONS
     },
     {
         "name": "get_user_info",
         "title": "Get User Info",
         "description": "Get information about the authenticated user",
-        "inputSchema": {"type": "object", "properties": {}, "required": []},
-        "annotations": {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+        "inputSchema": _EMPTY_INPUT_SCHEMA,
+        "annotations": _READ_ONLY_ANNOTATIONS
     },
     {
         "name": "list_clusters",
         "title": "List Resource Pools",
         "description": "List your registered BYOC resource pools (client-owned Kubernetes clusters). Each returned cluster has an 'id' you MUST pass as create_project's cluster_id to deploy a project onto your own infrastructure — owned hosting is retired, so every project we operate runs on your own cluster. Registering a pool is a UI action (create a bare Ubuntu box, authorise the key we generate, then we provision it into a cluster automatically) — this tool only lists pools you already registered, it never handles cluster credentials.",
-        "inputSchema": {"type": "object", "properties": {}, "required": []},
-        "annotations": {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+        "inputSchema": _EMPTY_INPUT_SCHEMA,
+        "annotations": _READ_ONLY_ANNOTATIONS
     },
     {
         "name": "get_job_status",
@@ -115,60 +128,42 @@ BACKEND_TOOLS = [
             },
             "required": ["job_id"]
         },
-        "annotations": {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+        "annotations": _READ_ONLY_ANNOTATIONS
     },
     {
         "name": "get_project_info",
         "title": "Get Project Info",
         "description": "Get detailed project info including deployment status and resource usage. DEPLOYMENT STATUS: Running (healthy), Pending (starting), CrashLoopBackOff (init container failed - usually schema format error), ImagePullBackOff (image build failed). TROUBLESHOOTING: If status is CrashLoopBackOff, the schema is likely in wrong format (nested 'fields' key or missing 'type' properties). Use get_schema to review current schema. If replicas show 0/2, the init container (migration runner) is failing. This is almost always a schema format issue.",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"}
-            },
-            "required": ["project_id"]
-        },
-        "annotations": {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+        "inputSchema": _PROJECT_ID_INPUT_SCHEMA,
+        "annotations": _READ_ONLY_ANNOTATIONS
     },
     {
         "name": "get_version_history",
         "title": "Get Version History",
         "description": "Get the deployment and version history (git commits) for a project. Shows all schema changes with commit SHA, timestamp, and message. USE CASES: Review what changed between deployments, find the last working version before issues started, get commit SHA for rollback_project.",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"}
-            },
-            "required": ["project_id"]
-        },
-        "annotations": {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+        "inputSchema": _PROJECT_ID_INPUT_SCHEMA,
+        "annotations": _READ_ONLY_ANNOTATIONS
     },
     {
         "name": "get_template_schemas",
         "title": "Get Template Schemas",
         "description": "Get pre-built template schemas for common use cases. ⭐ USE THIS FIRST when creating a new project! Templates show the CORRECT schema format with: proper FLAT structure (no 'fields' nesting), every field has a 'type' property, foreign key relationships configured correctly, best practices for field naming and types. Available templates: E-commerce (products, orders, customers), Team collaboration (projects, tasks, users), General purpose templates. You can use these templates directly with create_project or modify them for your needs. TIP: Study these templates to understand the correct schema format before creating custom schemas.",
-        "inputSchema": {"type": "object", "properties": {}, "required": []},
-        "annotations": {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+        "inputSchema": _EMPTY_INPUT_SCHEMA,
+        "annotations": _READ_ONLY_ANNOTATIONS
     },
     {
         "name": "get_subscription_status",
         "title": "Get Subscription Status",
         "description": "Get your subscription tier, limits, and usage",
-        "inputSchema": {"type": "object", "properties": {}, "required": []},
-        "annotations": {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+        "inputSchema": _EMPTY_INPUT_SCHEMA,
+        "annotations": _READ_ONLY_ANNOTATIONS
     },
     {
         "name": "get_project_usage",
         "title": "Get Project Usage",
         "description": "Get resource usage metrics (CPU, memory) for a project",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"}
-            },
-            "required": ["project_id"]
-        },
-        "annotations": {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+        "inputSchema": _PROJECT_ID_INPUT_SCHEMA,
+        "annotations": _READ_ONLY_ANNOTATIONS
     },
     {
         "name": "get_schema_at_version",
@@ -177,12 +172,12 @@ BACKEND_TOOLS = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"},
+                "project_id": _PROJECT_ID_PROPERTY,
                 "version": {"type": "string", "description": "Commit SHA of the version"}
             },
             "required": ["project_id", "version"]
         },
-        "annotations": {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+        "annotations": _READ_ONLY_ANNOTATIONS
     },
     {
         "name": "create_project",
@@ -268,7 +263,7 @@ After creation, use get_job_status with returned job_id to monitor deployment.""
             },
             "required": ["name", "schema", "cluster_id"]
         },
-        "annotations": {"readOnlyHint": False, "destructiveHint": False, "idempotentHint": False, "openWorldHint": True}
+        "annotations": _WRITE_ANNOTATIONS
     },
     {
         "name": "update_schema",
@@ -299,51 +294,33 @@ NOTE: This only saves the schema. You MUST call deploy_staging afterwards to app
         "inputSchema": {
             "type": "object",
             "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"},
+                "project_id": _PROJECT_ID_PROPERTY,
                 "schema": {"type": "object", "description": "New JSON schema in FLAT format (table_name → field_name → properties). Every field MUST have a 'type' property."}
             },
             "required": ["project_id", "schema"]
         },
-        "annotations": {"readOnlyHint": False, "destructiveHint": False, "idempotentHint": True, "openWorldHint": True}
+        "annotations": _IDEMPOTENT_WRITE_ANNOTATIONS
     },
     {
         "name": "deploy_staging",
         "title": "Deploy to Staging",
         "description": "Deploy a project to the staging environment. This triggers: (1) Schema validation, (2) Docker image build, (3) GitHub commit, (4) Kubernetes deployment, (5) Database migrations. The operation is ASYNCHRONOUS - it returns immediately with a job_id. Use get_job_status with the job_id to monitor progress. Deployment typically takes 2-5 minutes depending on schema complexity. If deployment fails, check: (1) Schema format is FLAT (no 'fields' nesting), (2) Every field has a 'type' property, (3) Foreign keys reference existing tables, (4) No PostgreSQL reserved words in table/field names. Use get_project_info to see if the deployment succeeded.",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"}
-            },
-            "required": ["project_id"]
-        },
-        "annotations": {"readOnlyHint": False, "destructiveHint": False, "idempotentHint": False, "openWorldHint": True}
+        "inputSchema": _PROJECT_ID_INPUT_SCHEMA,
+        "annotations": _WRITE_ANNOTATIONS
     },
     {
         "name": "deploy_production",
         "title": "Deploy to Production",
         "description": "Promote staging to production (requires paid plan)",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"}
-            },
-            "required": ["project_id"]
-        },
-        "annotations": {"readOnlyHint": False, "destructiveHint": False, "idempotentHint": False, "openWorldHint": True}
+        "inputSchema": _PROJECT_ID_INPUT_SCHEMA,
+        "annotations": _WRITE_ANNOTATIONS
     },
     {
         "name": "delete_project",
         "title": "Delete Project",
         "description": "Delete a project (removes GitHub repo, K8s deployments, and database)",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"}
-            },
-            "required": ["project_id"]
-        },
-        "annotations": {"readOnlyHint": False, "destructiveHint": True, "idempotentHint": False, "openWorldHint": True}
+        "inputSchema": _PROJECT_ID_INPUT_SCHEMA,
+        "annotations": _DESTRUCTIVE_ANNOTATIONS
     },
     {
         "name": "rollback_project",
@@ -352,13 +329,13 @@ NOTE: This only saves the schema. You MUST call deploy_staging afterwards to app
         "inputSchema": {
             "type": "object",
             "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"},
+                "project_id": _PROJECT_ID_PROPERTY,
                 "version": {"type": "string", "description": "Commit SHA or version to rollback to"},
                 "environment": {"type": "string", "description": "Environment: staging or production (default: staging)"}
             },
             "required": ["project_id", "version"]
         },
-        "annotations": {"readOnlyHint": False, "destructiveHint": True, "idempotentHint": False, "openWorldHint": True}
+        "annotations": _DESTRUCTIVE_ANNOTATIONS
     },
     {
         "name": "rename_project",
@@ -367,12 +344,12 @@ NOTE: This only saves the schema. You MUST call deploy_staging afterwards to app
         "inputSchema": {
             "type": "object",
             "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"},
+                "project_id": _PROJECT_ID_PROPERTY,
                 "name": {"type": "string", "description": "New display name for the project"}
             },
             "required": ["project_id", "name"]
         },
-        "annotations": {"readOnlyHint": False, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+        "annotations": _IDEMPOTENT_LOCAL_WRITE_ANNOTATIONS
     },
 ]
 
@@ -389,38 +366,22 @@ GRAPH_TOOLS = [
         "name": "get_graph_schema",
         "title": "Get Graph Schema",
         "description": "Get the graph schema definition of a project. Returns the hierarchical schema with nodes (entities) and relationships. Graph schemas define entity hierarchies and typed relationships — a different format than relational flat-table schemas.",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"}
-            },
-            "required": ["project_id"]
-        },
-        "annotations": {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+        "inputSchema": _PROJECT_ID_INPUT_SCHEMA,
+        "annotations": _READ_ONLY_ANNOTATIONS
     },
     {
         "name": "get_graph_template_schemas",
         "title": "Get Graph Template Schemas",
         "description": """Get pre-built graph template schemas for common use cases. ⭐ USE THIS FIRST when creating a new graph project! Templates show the CORRECT graph schema format with: proper node definitions (description, flat_labels, schema with flat field definitions), relationship configurations (from, to, cardinality, data_schema), and hierarchical entity nesting. Available templates: Social Network (users, posts, follows), Knowledge Graph (topics, articles, authors), Product Catalog (products, categories, suppliers). You can use these templates directly with create_graph_project or modify them for your needs. TIP: Study these templates to understand the correct graph schema format before creating custom schemas.""",
-        "inputSchema": {
-            "type": "object",
-            "properties": {},
-            "required": []
-        },
-        "annotations": {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+        "inputSchema": _EMPTY_INPUT_SCHEMA,
+        "annotations": _READ_ONLY_ANNOTATIONS
     },
     {
         "name": "get_graph_version_history",
         "title": "Get Graph Version History",
         "description": "Get the deployment and version history for a graph project. Shows all schema changes with commit SHAs, timestamps, version numbers, and messages. Use this to find a specific version for rollback operations.",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"}
-            },
-            "required": ["project_id"]
-        },
-        "annotations": {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+        "inputSchema": _PROJECT_ID_INPUT_SCHEMA,
+        "annotations": _READ_ONLY_ANNOTATIONS
     },
     {
         "name": "get_graph_schema_at_version",
@@ -429,25 +390,19 @@ GRAPH_TOOLS = [
         "inputSchema": {
             "type": "object",
             "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"},
+                "project_id": _PROJECT_ID_PROPERTY,
                 "version": {"type": "string", "description": "Commit SHA of the version to retrieve"}
             },
             "required": ["project_id", "version"]
         },
-        "annotations": {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+        "annotations": _READ_ONLY_ANNOTATIONS
     },
     {
         "name": "get_graph_project_info",
         "title": "Get Graph Project Info",
         "description": "Get detailed graph project information including Kubernetes deployment status, Neo4j database health, pod status, and resource usage. Use this after deployment to verify the graph project is running correctly.",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"}
-            },
-            "required": ["project_id"]
-        },
-        "annotations": {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+        "inputSchema": _PROJECT_ID_INPUT_SCHEMA,
+        "annotations": _READ_ONLY_ANNOTATIONS
     },
     # ========================================================================
     # WRITE TOOLS
@@ -550,7 +505,7 @@ After creation, use get_job_status with returned job_id to monitor deployment.""
             },
             "required": ["name", "schema", "cluster_id"]
         },
-        "annotations": {"readOnlyHint": False, "destructiveHint": False, "idempotentHint": False, "openWorldHint": True}
+        "annotations": _WRITE_ANNOTATIONS
     },
     {
         "name": "update_graph_schema",
@@ -577,51 +532,33 @@ NOTE: This only saves the schema. You MUST call deploy_graph_staging afterwards
         "inputSchema": {
             "type": "object",
             "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"},
+                "project_id": _PROJECT_ID_PROPERTY,
                 "schema": {"type": "object", "description": "New graph schema with 'nodes' and optionally 'relationships' keys."}
             },
             "required": ["project_id", "schema"]
         },
-        "annotations": {"readOnlyHint": False, "destructiveHint": False, "idempotentHint": True, "openWorldHint": True}
+        "annotations": _IDEMPOTENT_WRITE_ANNOTATIONS
     },
     {
         "name": "deploy_graph_staging",
         "title": "Deploy Graph to Staging",
         "description": "Deploy a graph project to the staging environment. This triggers: (1) Schema validation, (2) Neo4j entity code generation, (3) Docker image build, (4) GitHub commit, (5) Kubernetes deployment with Neo4j instance. The operation is ASYNCHRONOUS — returns immediately with a job_id. Use get_job_status to monitor progress. Deployment typically takes 2-5 minutes. Use get_graph_project_info to verify deployment succeeded.",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"}
-            },
-            "required": ["project_id"]
-        },
-        "annotations": {"readOnlyHint": False, "destructiveHint": False, "idempotentHint": False, "openWorldHint": True}
+        "inputSchema": _PROJECT_ID_INPUT_SCHEMA,
+        "annotations": _WRITE_ANNOTATIONS
     },
     {
         "name": "deploy_graph_production",
         "title": "Deploy Graph to Production",
         "description": "Promote graph staging to production. Creates a separate production Neo4j instance with its own credentials and database. Requires paid plan.",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"}
-            },
-            "required": ["project_id"]
-        },
-        "annotations": {"readOnlyHint": False, "destructiveHint": False, "idempotentHint": False, "openWorldHint": True}
+        "inputSchema": _PROJECT_ID_INPUT_SCHEMA,
+        "annotations": _WRITE_ANNOTATIONS
     },
     {
         "name": "delete_graph_project",
         "title": "Delete Graph Project",
         "description": "Delete a graph project (removes GitHub repo, K8s deployments, Neo4j database, and credentials)",
-        "inputSchema": {
-            "type": "object",
-            "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"}
-            },
-            "required": ["project_id"]
-        },
-        "annotations": {"readOnlyHint": False, "destructiveHint": True, "idempotentHint": False, "openWorldHint": True}
+        "inputSchema": _PROJECT_ID_INPUT_SCHEMA,
+        "annotations": _DESTRUCTIVE_ANNOTATIONS
     },
     {
         "name": "rollback_graph_project",
@@ -630,13 +567,13 @@ NOTE: This only saves the schema. You MUST call deploy_graph_staging afterwards
         "inputSchema": {
             "type": "object",
             "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"},
+                "project_id": _PROJECT_ID_PROPERTY,
                 "version": {"type": "string", "description": "Commit SHA to rollback to"},
                 "environment": {"type": "string", "description": "Environment: staging or production (default: staging)"}
             },
             "required": ["project_id", "version"]
         },
-        "annotations": {"readOnlyHint": False, "destructiveHint": True, "idempotentHint": False, "openWorldHint": True}
+        "annotations": _DESTRUCTIVE_ANNOTATIONS
     },
 ]
 
@@ -668,7 +605,7 @@ The entity_id is your unique identifier — use meaningful IDs for knowledge gra
         "inputSchema": {
             "type": "object",
             "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"},
+                "project_id": _PROJECT_ID_PROPERTY,
                 "entity_type": {"type": "string", "description": "Entity key (e.g., 'person', 'concept')"},
                 "entity_id": {"type": "string", "description": "Unique identifier for the node"},
                 "data": {"type": "object", "description": "Node properties matching the entity schema"},
@@ -676,7 +613,7 @@ The entity_id is your unique identifier — use meaningful IDs for knowledge gra
             },
             "required": ["project_id", "entity_type", "entity_id", "data"]
         },
-        "annotations": {"readOnlyHint": False, "destructiveHint": False, "idempotentHint": False, "openWorldHint": True}
+        "annotations": _WRITE_ANNOTATIONS
     },
     {
         "name": "get_graph_node",
@@ -685,14 +622,14 @@ The entity_id is your unique identifier — use meaningful IDs for knowledge gra
         "inputSchema": {
             "type": "object",
             "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"},
+                "project_id": _PROJECT_ID_PROPERTY,
                 "entity_type": {"type": "string", "description": "Entity key (e.g., 'person', 'concept')"},
                 "entity_id": {"type": "string", "description": "The node's entity_id"},
                 "environment": {"type": "string", "description": "Environment: staging or production (default: staging)"}
             },
             "required": ["project_id", "entity_type", "entity_id"]
         },
-        "annotations": {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+        "annotations": _READ_ONLY_ANNOTATIONS
     },
     {
         "name": "list_graph_nodes",
@@ -701,7 +638,7 @@ The entity_id is your unique identifier — use meaningful IDs for knowledge gra
         "inputSchema": {
             "type": "object",
             "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"},
+                "project_id": _PROJECT_ID_PROPERTY,
                 "entity_type": {"type": "string", "description": "Entity key (e.g., 'person', 'concept')"},
                 "limit": {"type": "integer", "description": "Max results (default: 100, max: 1000)"},
                 "offset": {"type": "integer", "description": "Pagination offset (default: 0)"},
@@ -709,7 +646,7 @@ The entity_id is your unique identifier — use meaningful IDs for knowledge gra
             },
             "required": ["project_id", "entity_type"]
         },
-        "annotations": {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+        "annotations": _READ_ONLY_ANNOTATIONS
     },
     {
         "name": "update_graph_node",
@@ -718,7 +655,7 @@ The entity_id is your unique identifier — use meaningful IDs for knowledge gra
         "inputSchema": {
             "type": "object",
             "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"},
+                "project_id": _PROJECT_ID_PROPERTY,
                 "entity_type": {"type": "string", "description": "Entity key (e.g., 'person', 'concept')"},
                 "entity_id": {"type": "string", "description": "The node's entity_id"},
                 "data": {"type": "object", "description": "Properties to update (partial update)"},
@@ -726,7 +663,7 @@ The entity_id is your unique identifier — use meaningful IDs for knowledge gra
             },
             "required": ["project_id", "entity_type", "entity_id", "data"]
         },
-        "annotations": {"readOnlyHint": False, "destructiveHint": False, "idempotentHint": True, "openWorldHint": True}
+        "annotations": _IDEMPOTENT_WRITE_ANNOTATIONS
     },
     {
         "name": "delete_graph_node",
@@ -735,14 +672,14 @@ The entity_id is your unique identifier — use meaningful IDs for knowledge gra
         "inputSchema": {
             "type": "object",
             "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"},
+                "project_id": _PROJECT_ID_PROPERTY,
                 "entity_type": {"type": "string", "description": "Entity key (e.g., 'person', 'concept')"},
                 "entity_id": {"type": "string", "description": "The node's entity_id"},
                 "environment": {"type": "string", "description": "Environment: staging or production (default: staging)"}
             },
             "required": ["project_id", "entity_type", "entity_id"]
         },
-        "annotations": {"readOnlyHint": False, "destructiveHint": True, "idempotentHint": False, "openWorldHint": True}
+        "annotations": _DESTRUCTIVE_ANNOTATIONS
     },
     # ========================================================================
     # RELATIONSHIP OPERATIONS
@@ -765,7 +702,7 @@ The from_id and to_id must be entity_ids of existing nodes.""",
         "inputSchema": {
             "type": "object",
             "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"},
+                "project_id": _PROJECT_ID_PROPERTY,
                 "rel_type": {"type": "string", "description": "Relationship key (e.g., 'authored', 'related_to')"},
                 "from_id": {"type": "string", "description": "Source node entity_id"},
                 "to_id": {"type": "string", "description": "Target node entity_id"},
@@ -774,7 +711,7 @@ The from_id and to_id must be entity_ids of existing nodes.""",
             },
             "required": ["project_id", "rel_type", "from_id", "to_id"]
         },
-        "annotations": {"readOnlyHint": False, "destructiveHint": False, "idempotentHint": False, "openWorldHint": True}
+        "annotations": _WRITE_ANNOTATIONS
     },
     {
         "name": "get_node_relationships",
@@ -783,7 +720,7 @@ The from_id and to_id must be entity_ids of existing nodes.""",
         "inputSchema": {
             "type": "object",
             "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"},
+                "project_id": _PROJECT_ID_PROPERTY,
                 "entity_type": {"type": "string", "description": "Entity key of the node"},
                 "entity_id": {"type": "string", "description": "The node's entity_id"},
                 "direction": {"type": "string", "description": "Filter: incoming, outgoing, or both (default: both)"},
@@ -792,7 +729,7 @@ The from_id and to_id must be entity_ids of existing nodes.""",
             },
             "required": ["project_id", "entity_type", "entity_id"]
         },
-        "annotations": {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+        "annotations": _READ_ONLY_ANNOTATIONS
     },
     {
         "name": "delete_graph_relationship",
@@ -801,14 +738,14 @@ The from_id and to_id must be entity_ids of existing nodes.""",
         "inputSchema": {
             "type": "object",
             "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"},
+                "project_id": _PROJECT_ID_PROPERTY,
                 "rel_type": {"type": "string", "description": "Relationship key"},
                 "rel_id": {"type": "integer", "description": "Internal relationship ID (from get_node_relationships)"},
                 "environment": {"type": "string", "description": "Environment: staging or production (default: staging)"}
             },
             "required": ["project_id", "rel_type", "rel_id"]
         },
-        "annotations": {"readOnlyHint": False, "destructiveHint": True, "idempotentHint": False, "openWorldHint": True}
+        "annotations": _DESTRUCTIVE_ANNOTATIONS
     },
     # ========================================================================
     # BULK OPERATIONS
@@ -832,7 +769,7 @@ Example:
         "inputSchema": {
             "type": "object",
             "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"},
+                "project_id": _PROJECT_ID_PROPERTY,
                 "entity_type": {"type": "string", "description": "Entity key for all nodes"},
                 "nodes": {
                     "type": "array",
@@ -850,7 +787,7 @@ Example:
             },
             "required": ["project_id", "entity_type", "nodes"]
         },
-        "annotations": {"readOnlyHint": False, "destructiveHint": False, "idempotentHint": False, "openWorldHint": True}
+        "annotations": _WRITE_ANNOTATIONS
     },
     {
         "name": "bulk_create_graph_relationships",
@@ -870,7 +807,7 @@ Example:
         "inputSchema": {
             "type": "object",
             "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"},
+                "project_id": _PROJECT_ID_PROPERTY,
                 "rel_type": {"type": "string", "description": "Relationship key for all relationships"},
                 "relationships": {
                     "type": "array",
@@ -889,7 +826,7 @@ Example:
             },
             "required": ["project_id", "rel_type", "relationships"]
         },
-        "annotations": {"readOnlyHint": False, "destructiveHint": False, "idempotentHint": False, "openWorldHint": True}
+        "annotations": _WRITE_ANNOTATIONS
     },
     # ========================================================================
     # SEARCH & QUERY
@@ -910,7 +847,7 @@ Without entity_type, searches ALL node types.""",
         "inputSchema": {
             "type": "object",
             "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"},
+                "project_id": _PROJECT_ID_PROPERTY,
                 "entity_type": {"type": "string", "description": "Entity key to filter by (optional — omit to search all types)"},
                 "filters": {"type": "object", "description": "Property filters. Prefix value with ~ for contains search."},
                 "limit": {"type": "integer", "description": "Max results (default: 100, max: 1000)"},
@@ -919,7 +856,7 @@ Without entity_type, searches ALL node types.""",
             },
             "required": ["project_id", "filters"]
         },
-        "annotations": {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+        "annotations": _READ_ONLY_ANNOTATIONS
     },
     {
         "name": "fulltext_search_graph",
@@ -936,7 +873,7 @@ Optionally filter by entity_type to narrow results.""",
         "inputSchema": {
             "type": "object",
             "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"},
+                "project_id": _PROJECT_ID_PROPERTY,
                 "query": {"type": "string", "description": "Search text (case-insensitive, min 2 chars)"},
                 "entity_type": {"type": "string", "description": "Entity key to filter by (optional — omit to search all types)"},
                 "limit": {"type": "integer", "description": "Max results (default: 50, max: 500)"},
@@ -945,7 +882,7 @@ Optionally filter by entity_type to narrow results.""",
             },
             "required": ["project_id", "query"]
         },
-        "annotations": {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+        "annotations": _READ_ONLY_ANNOTATIONS
     },
     {
         "name": "traverse_graph",
@@ -965,7 +902,7 @@ Supports filtering by relationship types and direction.""",
         "inputSchema": {
             "type": "object",
             "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"},
+                "project_id": _PROJECT_ID_PROPERTY,
                 "start_entity_type": {"type": "string", "description": "Entity key of the starting node"},
                 "start_entity_id": {"type": "string", "description": "Entity ID of the starting node"},
                 "max_depth": {"type": "integer", "description": "Maximum traversal depth (default: 3, max: 10)"},
@@ -980,7 +917,7 @@ Supports filtering by relationship types and direction.""",
             },
             "required": ["project_id", "start_entity_type", "start_entity_id"]
         },
-        "annotations": {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+        "annotations": _READ_ONLY_ANNOTATIONS
     },
     # ========================================================================
     # STATISTICS & INTROSPECTION
@@ -992,12 +929,12 @@ Supports filtering by relationship types and direction.""",
         "inputSchema": {
             "type": "object",
             "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"},
+                "project_id": _PROJECT_ID_PROPERTY,
                 "environment": {"type": "string", "description": "Environment: staging or production (default: staging)"}
             },
             "required": ["project_id"]
         },
-        "annotations": {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+        "annotations": _READ_ONLY_ANNOTATIONS
     },
     {
         "name": "get_graph_data_schema",
@@ -1010,12 +947,12 @@ Returns: Available entity keys (for create_graph_node, list_graph_nodes, etc.) a
         "inputSchema": {
             "type": "object",
             "properties": {
-                "project_id": {"type": "string", "description": "Project ID (UUID)"},
+                "project_id": _PROJECT_ID_PROPERTY,
                 "environment": {"type": "string", "description": "Environment: staging or production (default: staging)"}
             },
             "required": ["project_id"]
         },
-        "annotations": {"readOnlyHint": True, "destructiveHint": False, "idempotentHint": True, "openWorldHint": False}
+        "annotations": _READ_ONLY_ANNOTATIONS
     },
 ]
 
@@ -1077,12 +1014,227 @@ GRAPH_PROMPTS = [
 ]
 
 
+# ============================================================================
+# PROMPT TEMPLATES
+# ============================================================================
+# Static prompt bodies, built once at import. Handlers only prepend the
+# user's input - no per-call rebuild of the full template.
+
+_CREATE_PROJECT_PROMPT_BODY = """═══════════════════════════════════════════════════════════════════════════
+CRITICAL SCHEMA RULES - FOLLOW EXACTLY:
+═══════════════════════════════════════════════════════════════════════════
+
+1. FLAT FORMAT (REQUIRED):
+   ✅ CORRECT: {"users": {"email": {"type": "string", "max_length": 255}}}
+   ❌ WRONG: {"users": {"fields": {"email": {"type": "string"}}}}
+   DO NOT nest under 'fields' key!
+
+2. FIELD TYPE REQUIREMENTS:
+   • string: MUST have "max_length" (e.g., "max_length": 255)
+   • decimal: MUST have "precision" and "scale" (e.g., "precision": 10, "scale": 2)
+   • datetime: Use "datetime" NOT "timestamp"
+   • ALL fields: MUST have "type" property
+
+3. AUTOMATIC FIELDS (DON'T define):
+   • id (uuid, primary key)
+   • created_at (datetime)
+   • updated_at (datetime)
+
+4. USER AUTHENTICATION:
+   ❌ NEVER create "users", "customers", "employees", "members" tables
+   ✅ USE built-in app_users table
+   
+   Example:
+   {
+     "employee_profiles": {
+       "user_id": {"type": "uuid", "foreign_key": "app_users.id", "required": true},
+       "department": {"type": "string", "max_length": 100}
+     }
+   }
+
+5. AUTHORIZATION (user ownership):
+   • Add user_id foreign key to app_users.id for user-owned resources
+   
+   Example:
+   {
+     "orders": {
+       "user_id": {"type": "uuid", "foreign_key": "app_users.id"},
+       "total": {"type": "decimal", "precision": 10, "scale": 2}
+     }
+   }
+
+6. FIELD OPTIONS:
+   • required: true/false
+   • unique: true/false
+   • default: any value
+   • enum: ["value1", "value2"]
+   • foreign_key: "table_name.id"
+
+AVAILABLE TYPES: string, text, integer, decimal, boolean, uuid, date, datetime, json, uuid_array, integer_array, text_array, float_array
+
+   Array types store PostgreSQL native arrays with automatic GIN indexing:
+   • uuid_array: UUID[] — for sets of references (e.g., tensor coordinates)
+   • integer_array: BIGINT[] — for dimension indices, integer sets
+   • text_array: TEXT[] — for tags, categories, label sets
+   • float_array: DOUBLE PRECISION[] — for weight vectors, scores
+
+═══════════════════════════════════════════════════════════════════════════
+
+Generate the schema now following ALL rules above:"""
+
+_FIX_SCHEMA_PROMPT_BODY = """═══════════════════════════════════════════════════════════════════════════
+COMMON SCHEMA ERRORS:
+═══════════════════════════════════════════════════════════════════════════
+
+1. NESTED 'fields' KEY:
+   ❌ {"users": {"fields": {"email": {...}}}}
+   ✅ {"users": {"email": {...}}}
+
+2. MISSING TYPE PROPERTY:
+   ❌ {"name": {"required": true}}
+   ✅ {"name": {"type": "string", "max_length": 100, "required": true}}
+
+3. STRING WITHOUT max_length:
+   ❌ {"email": {"type": "string"}}
+   ✅ {"email": {"type": "string", "max_length": 255}}
+
+4. DECIMAL WITHOUT precision/scale:
+   ❌ {"price": {"type": "decimal"}}
+   ✅ {"price": {"type": "decimal", "precision": 10, "scale": 2}}
+
+5. USING "timestamp" INSTEAD OF "datetime":
+   ❌ {"created": {"type": "timestamp"}}
+   ✅ {"created": {"type": "datetime"}}
+
+6. DEFINING AUTOMATIC FIELDS:
+   ❌ {"id": {...}}, {"created_at": {...}}, {"updated_at": {...}}
+   ✅ Don't define these - they're automatic
+
+7. CREATING users/customers/employees TABLE:
+   ❌ {"users": {"email": {...}, "password": {...}}}
+   ✅ Use app_users pattern with foreign key
+
+CHECK ALL THESE ISSUES and provide the corrected schema:"""
+
+_CREATE_GRAPH_PROJECT_PROMPT_BODY = """═══════════════════════════════════════════════════════════════════════════
+GRAPH SCHEMA FORMAT — FOLLOW EXACTLY:
+═══════════════════════════════════════════════════════════════════════════
+
+Graph schemas define nodes (entities) and relationships — NOT flat database tables.
+Each field is a dict with "type" and optional "required": true (defaults to false).
+
+STRUCTURE:
+{
+  "nodes": {
+    "EntityName": {
+      "description": "What this entity represents",
+      "flat_labels": ["AdditionalLabel"],
+      "schema": {
+        "field_name": {"type": "string", "required": true},
+        "other_field": {"type": "integer"}
+      }
+    }
+  },
+  "relationships": {
+    "RELATIONSHIP_TYPE": {
+      "from": "EntityName",
+      "to": "OtherEntity",
+      "cardinality": "MANY_TO_MANY",
+      "data_schema": {
+        "field_name": {"type": "date"}
+      }
+    }
+  }
+}
+
+FIELD TYPES: string, integer, float, boolean, date, json
+
+CARDINALITY: ONE_TO_ONE, ONE_TO_MANY, MANY_TO_ONE, MANY_TO_MANY
+
+RULES:
+1. "nodes" key is REQUIRED — must contain at least one entity
+2. Each entity needs "description" and "schema" with field definitions
+3. Each field is {"type": "...", "required": true/false} — required defaults to false
+4. Relationship "from"/"to" must reference defined node names
+5. Relationship types: UPPER_SNAKE_CASE (e.g., FOLLOWS, CREATED_BY)
+6. Entity names: PascalCase (e.g., Person, Product)
+7. Nest entities inside parents to create type hierarchies
+8. Automatic fields (id, created_at, updated_at) are NOT needed
+
+HIERARCHICAL EXAMPLE:
+{
+  "nodes": {
+    "Vehicle": {
+      "description": "A vehicle",
+      "flat_labels": ["Transport"],
+      "schema": {
+        "make": {"type": "string", "required": true},
+        "model": {"type": "string", "required": true},
+        "year": {"type": "integer"}
+      },
+      "Car": {
+        "description": "A car (inherits Vehicle labels)",
+        "flat_labels": ["Automobile"],
+        "schema": {
+          "doors": {"type": "integer", "required": true},
+          "electric": {"type": "boolean"}
+        }
+      }
+    }
+  }
+}
+
+Generate the graph schema now following ALL rules above:"""
+
+
 # ============================================================================
 # BACKEND MCP SERVER
 # ============================================================================
 
 # All tools are infrastructure-only (44 tools)
 INFRASTRUCTURE_TOOLS = BACKEND_TOOLS + GRAPH_TOOLS + GRAPH_DATA_TOOLS
+INFRASTRUCTURE_PROMPTS = BACKEND_PROMPTS + GRAPH_PROMPTS
+
+# Tools the client may resend on any 503 - read-only or declared idempotent.
+# Everything else (create/deploy/delete/bulk writes) is only retried when
+# the gateway explicitly sheds load (429, or 503 with Retry-After).
+IDEMPOTENT_TOOLS = frozenset(
+    tool["name"]
+    for tool in INFRASTRUCTURE_TOOLS
+    if tool["annotations"].get("readOnlyHint") or tool["annotations"].get("idempotentHint")
+)
+
+# Upper bound on pooled LogicBlok clients (one per API key). Only matters
+# in HTTP mode, where every tenant brings its own key.
+MAX_POOLED_CLIENTS = 64
+
+# Read-only tools whose results may be served from cache (TTL in seconds)
+# Account-level / catalog data, plus schema snapshots addressed by commit
+# SHA (immutable - a given version never changes)
+READ_CACHE_TTLS: dict[str, float] = {
+    "get_template_schemas": 3600.0,
+    "get_graph_template_schemas": 3600.0,
+    "get_user_info": 60.0,
+    "get_subscription_status": 60.0,
+    "get_schema_at_version": 86400.0,
+    "get_graph_schema_at_version": 86400.0,
+    # Coalesces tight polling loops to one gateway call per window
+    "get_job_status": 2.0,
+}
+
+# A finished job never changes state again - keep it for 10 minutes
+# instead of the polling TTL above
+JOB_TERMINAL_STATUSES = frozenset({"completed", "failed"})
+JOB_TERMINAL_TTL = 600.0
+
+# Write tools that change a cached read (subscription usage counts
+# projects) - the caller's cached entry is dropped once the write succeeds
+READ_CACHE_INVALIDATIONS: dict[str, tuple[str, ...]] = {
+    "create_project": ("get_subscription_status",),
+    "delete_project": ("get_subscription_status",),
+    "create_graph_project": ("get_subscription_status",),
+    "delete_graph_project": ("get_subscription_status",),
+}
 
 
 class BackendMCPServer(BaseMCPServer):
@@ -1158,7 +1310,7 @@ Full documentation: https://infra.rationalbloks.com/documentation"""
     def __init__(
         self,
         api_key: str | None = None,
-        http_mode: bool = False,
+        transport: str = "stdio",
     ) -> None:
         # Initialize backend MCP server
         super().__init__(
@@ -1166,15 +1318,24 @@ Full documentation: https://infra.rationalbloks.com/documentation"""
             version=__version__,
             instructions=self.INSTRUCTIONS,
             api_key=api_key,
-            http_mode=http_mode,
+            transport=transport,
         )
         
-        # Register infrastructure tools and prompts
-        self.register_tools(BACKEND_TOOLS)
-        self.register_tools(GRAPH_TOOLS)
-        self.register_tools(GRAPH_DATA_TOOLS)
-        self.register_prompts(BACKEND_PROMPTS)
-        self.register_prompts(GRAPH_PROMPTS)
+        # Long-lived LogicBlok clients, one per API key
+        # Reusing the client keeps its httpx connection pool (TCP + TLS) warm
+        # across tool calls instead of re-handshaking on every invocation
+        # LRU-ordered and capped at MAX_POOLED_CLIENTS
+        # All of them share one httpx pool: tenants reuse the same warm
+        # connections to the gateway instead of each opening their own
+        self._http_client = LogicBlokClient.create_http_client()
+        self._clients: OrderedDict[str, LogicBlokClient] = OrderedDict()
+        
+        # Cached results for the tools listed in READ_CACHE_TTLS
+        self._read_cache = ResponseCache()
+        
+        # Register infrastructure tools and prompts (pre-merged, one pass each)
+        self.register_tools(INFRASTRUCTURE_TOOLS)
+        self.register_prompts(INFRASTRUCTURE_PROMPTS)
         
         # Register tool handler
         self.register_tool_handler("*", self._handle_backend_tool)
@@ -1196,12 +1357,31 @@ Full documentation: https://infra.rationalbloks.com/documentation"""
         # Set up MCP handlers
         self.setup_handlers()
     
-    def _get_client(self) -> LogicBlokClient:
-        # Get LogicBlok client with current API key
+    async def _get_client(self) -> LogicBlokClient:
+        # Get the pooled LogicBlok client for the current API key
+        # Evicts (and closes) the least recently used client when full
         api_key = self.get_api_key_for_request()
         if not api_key:
             raise ValueError("No API key available")
-        return LogicBlokClient(api_key)
+        client = self._clients.get(api_key)
+        if client is not None:
+            self._clients.move_to_end(api_key)
+            return client
+        client = LogicBlokClient(api_key, self._http_client)
+        self._clients[api_key] = client
+        if len(self._clients) > MAX_POOLED_CLIENTS:
+            _, evicted = self._clients.popitem(last=False)
+            await evicted.close()
+        return client
+    
+    async def close(self) -> None:
+        # Close all pooled LogicBlok clients and the shared httpx pool
+        # (overrides BaseMCPServer.close)
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.close()
+        await self._http_client.aclose()
     
     async def _handle_backend_tool(self, name: str, arguments: dict) -> Any:
         # Single dispatch: every tool is a passthrough to LogicBlok's
@@ -1211,8 +1391,32 @@ Full documentation: https://infra.rationalbloks.com/documentation"""
         # arguments and calling per-tool wrapper methods — all pure
         # pass-throughs that forced every new tool to be added in 3 places
         # (tool schema, client wrapper, dispatcher branch).
-        async with self._get_client() as client:
-            return await client.execute(name, arguments)
+        # The client is pooled - no async with, it outlives the call.
+        # Schema writes are pre-checked locally: a malformed schema would
+        # otherwise fail only after a full build and deploy.
+        if name in SCHEMA_TOOLS and "schema" in arguments:
+            validate_flat_schema(arguments["schema"])
+        client = await self._get_client()
+        ttl = READ_CACHE_TTLS.get(name)
+        if ttl is None:
+            result = await client.execute(name, arguments, name in IDEMPOTENT_TOOLS)
+            for stale in READ_CACHE_INVALIDATIONS.get(name, ()):
+                self._read_cache.invalidate(client.api_key, stale, None)
+            return result
+        
+        # Slow-changing read: serve from cache within its TTL
+        cached = self._read_cache.get(client.api_key, name, arguments)
+        if cached is not None:
+            return cached
+        result = await client.execute(name, arguments, name in IDEMPOTENT_TOOLS)
+        if (
+            name == "get_job_status"
+            and isinstance(result, dict)
+            and result.get("status") in JOB_TERMINAL_STATUSES
+        ):
+            ttl = JOB_TERMINAL_TTL
+        self._read_cache.set(client.api_key, name, arguments, result, ttl)
+        return result
 
     def _handle_create_project_prompt(
         self,
@@ -1228,69 +1432,7 @@ Full documentation: https://infra.rationalbloks.com/documentation"""
                     role="user",
                     content=TextContent(
                         type="text",
-                        text=f"""Create a RationalBloks project schema for: {description}
-
-═══════════════════════════════════════════════════════════════════════════
-CRITICAL SCHEMA RULES - FOLLOW EXACTLY:
-═══════════════════════════════════════════════════════════════════════════
-
-1. FLAT FORMAT (REQUIRED):
-   ✅ CORRECT: {{"users": {{"email": {{"type": "string", "max_length": 255}}}}}}
-   ❌ WRONG: {{"users": {{"fields": {{"email": {{"type": "string"}}}}}}}}
-   DO NOT nest under 'fields' key!
-
-2. FIELD TYPE REQUIREMENTS:
-   • string: MUST have "max_length" (e.g., "max_length": 255)
-   • decimal: MUST have "precision" and "scale" (e.g., "precision": 10, "scale": 2)
-   • datetime: Use "datetime" NOT "timestamp"
-   • ALL fields: MUST have "type" property
-
-3. AUTOMATIC FIELDS (DON'T define):
-   • id (uuid, primary key)
-   • created_at (datetime)
-   • updated_at (datetime)
-
-4. USER AUTHENTICATION:
-   ❌ NEVER create "users", "customers", "employees", "members" tables
-   ✅ USE built-in app_users table
-   
-   Example:
-   {{
-     "employee_profiles": {{
-       "user_id": {{"type": "uuid", "foreign_key": "app_users.id", "required": true}},
-       "department": {{"type": "string", "max_length": 100}}
-     }}
-   }}
-
-5. AUTHORIZATION (user ownership):
-   • Add user_id foreign key to app_users.id for user-owned resources
-   
-   Example:
-   {{
-     "orders": {{
-       "user_id": {{"type": "uuid", "foreign_key": "app_users.id"}},
-       "total": {{"type": "decimal", "precision": 10, "scale": 2}}
-     }}
-   }}
-
-6. FIELD OPTIONS:
-   • required: true/false
-   • unique: true/false
-   • default: any value
-   • enum: ["value1", "value2"]
-   • foreign_key: "table_name.id"
-
-AVAILABLE TYPES: string, text, integer, decimal, boolean, uuid, date, datetime, json, uuid_array, integer_array, text_array, float_array
-
-   Array types store PostgreSQL native arrays with automatic GIN indexing:
-   • uuid_array: UUID[] — for sets of references (e.g., tensor coordinates)
-   • integer_array: BIGINT[] — for dimension indices, integer sets
-   • text_array: TEXT[] — for tags, categories, label sets
-   • float_array: DOUBLE PRECISION[] — for weight vectors, scores
-
-═══════════════════════════════════════════════════════════════════════════
-
-Generate the schema now following ALL rules above:""",
+                        text=f"Create a RationalBloks project schema for: {description}\n\n{_CREATE_PROJECT_PROMPT_BODY}",
                     ),
                 )
             ]
@@ -1305,52 +1447,26 @@ Generate the schema now following ALL rules above:""",
         schema = arguments.get("schema", "{}") if arguments else "{}"
         error = arguments.get("error_message", "Unknown error") if arguments else "Unknown error"
         
+        # Lint the schema locally so the model fixes concrete violations
+        # instead of searching for them. Unparseable input keeps the plain
+        # checklist.
+        detected = ""
+        try:
+            parsed = orjson.loads(schema)
+        except orjson.JSONDecodeError:
+            parsed = None
+        if parsed is not None:
+            findings = find_schema_violations(parsed) + find_schema_warnings(parsed)
+            if findings:
+                detected = "Detected violations:\n" + "\n".join(f"- {f}" for f in findings) + "\n\n"
+        
         return GetPromptResult(
             messages=[
                 PromptMessage(
                     role="user",
                     content=TextContent(
                         type="text",
-                        text=f"""Fix this RationalBloks schema:
-
-Schema:
-{schema}
-
-Error: {error}
-
-═══════════════════════════════════════════════════════════════════════════
-COMMON SCHEMA ERRORS:
-═══════════════════════════════════════════════════════════════════════════
-
-1. NESTED 'fields' KEY:
-   ❌ {{"users": {{"fields": {{"email": {{...}}}}}}}}
-   ✅ {{"users": {{"email": {{...}}}}}}
-
-2. MISSING TYPE PROPERTY:
-   ❌ {{"name": {{"required": true}}}}
-   ✅ {{"name": {{"type": "string", "max_length": 100, "required": true}}}}
-
-3. STRING WITHOUT max_length:
-   ❌ {{"email": {{"type": "string"}}}}
-   ✅ {{"email": {{"type": "string", "max_length": 255}}}}
-
-4. DECIMAL WITHOUT precision/scale:
-   ❌ {{"price": {{"type": "decimal"}}}}
-   ✅ {{"price": {{"type": "decimal", "precision": 10, "scale": 2}}}}
-
-5. USING "timestamp" INSTEAD OF "datetime":
-   ❌ {{"created": {{"type": "timestamp"}}}}
-   ✅ {{"created": {{"type": "datetime"}}}}
-
-6. DEFINING AUTOMATIC FIELDS:
-   ❌ {{"id": {{...}}}}, {{"created_at": {{...}}}}, {{"updated_at": {{...}}}}
-   ✅ Don't define these - they're automatic
-
-7. CREATING users/customers/employees TABLE:
-   ❌ {{"users": {{"email": {{...}}, "password": {{...}}}}}}
-   ✅ Use app_users pattern with foreign key
-
-CHECK ALL THESE ISSUES and provide the corrected schema:""",
+                        text=f"Fix this RationalBloks schema:\n\nSchema:\n{schema}\n\nError: {error}\n\n{detected}{_FIX_SCHEMA_PROMPT_BODY}",
                     ),
                 )
             ]
@@ -1370,77 +1486,7 @@ CHECK ALL THESE ISSUES and provide the corrected schema:""",
                     role="user",
                     content=TextContent(
                         type="text",
-                        text=f"""Create a RationalBloks graph project schema for: {description}
-
-═══════════════════════════════════════════════════════════════════════════
-GRAPH SCHEMA FORMAT — FOLLOW EXACTLY:
-═══════════════════════════════════════════════════════════════════════════
-
-Graph schemas define nodes (entities) and relationships — NOT flat database tables.
-Each field is a dict with "type" and optional "required": true (defaults to false).
-
-STRUCTURE:
-{{
-  "nodes": {{
-    "EntityName": {{
-      "description": "What this entity represents",
-      "flat_labels": ["AdditionalLabel"],
-      "schema": {{
-        "field_name": {{"type": "string", "required": true}},
-        "other_field": {{"type": "integer"}}
-      }}
-    }}
-  }},
-  "relationships": {{
-    "RELATIONSHIP_TYPE": {{
-      "from": "EntityName",
-      "to": "OtherEntity",
-      "cardinality": "MANY_TO_MANY",
-      "data_schema": {{
-        "field_name": {{"type": "date"}}
-      }}
-    }}
-  }}
-}}
-
-FIELD TYPES: string, integer, float, boolean, date, json
-
-CARDINALITY: ONE_TO_ONE, ONE_TO_MANY, MANY_TO_ONE, MANY_TO_MANY
-
-RULES:
-1. "nodes" key is REQUIRED — must contain at least one entity
-2. Each entity needs "description" and "schema" with field definitions
-3. Each field is {{"type": "...", "required": true/false}} — required defaults to false
-4. Relationship "from"/"to" must reference defined node names
-5. Relationship types: UPPER_SNAKE_CASE (e.g., FOLLOWS, CREATED_BY)
-6. Entity names: PascalCase (e.g., Person, Product)
-7. Nest entities inside parents to create type hierarchies
-8. Automatic fields (id, created_at, updated_at) are NOT needed
-
-HIERARCHICAL EXAMPLE:
-{{
-  "nodes": {{
-    "Vehicle": {{
-      "description": "A vehicle",
-      "flat_labels": ["Transport"],
-      "schema": {{
-        "make": {{"type": "string", "required": true}},
-        "model": {{"type": "string", "required": true}},
-        "year": {{"type": "integer"}}
-      }},
-      "Car": {{
-        "description": "A car (inherits Vehicle labels)",
-        "flat_labels": ["Automobile"],
-        "schema": {{
-          "doors": {{"type": "integer", "required": true}},
-          "electric": {{"type": "boolean"}}
-        }}
-      }}
-    }}
-  }}
-}}
-
-Generate the graph schema now following ALL rules above:""",
+                        text=f"Create a RationalBloks graph project schema for: {description}\n\n{_CREATE_GRAPH_PROJECT_PROMPT_BODY}",
                     ),
                 )
             ]
@@ -1449,8 +1495,9 @@ Generate the graph schema now following ALL rules above:""",
 
 def create_backend_server(
     api_key: str | None = None,
-    http_mode: bool = False,
+    transport: str = "stdio",
 ) -> BackendMCPServer:
     # Factory function to create a backend MCP server
+    # transport: "stdio" for local IDEs or "http" for cloud
     # Returns: Configured BackendMCPServer instance
-    return BackendMCPServer(api_key=api_key, http_mode=http_mode)
+    return BackendMCPServer(api_key=api_key, transport=transport)
@@ -8,6 +8,7 @@
 #   - Base MCP server class
 #   - Transport layer (STDIO + HTTP)
 #   - Authentication utilities
+#   - Response cache for read-only tools
 #
 # ARCHITECTURE:
 # BackendMCPServer extends this core with 48 tools.
@@ -18,6 +19,10 @@ from .auth import (
     validate_api_key,
     extract_api_key_from_request,
     APIKeyCache,
+    hash_api_key,
+)
+from .cache import (
+    ResponseCache,
 )
 from .transport import (
     run_stdio,
@@ -34,6 +39,9 @@ __all__ = [
     "validate_api_key",
     "extract_api_key_from_request",
     "APIKeyCache",
+    "hash_api_key",
+    # Cache
+    "ResponseCache",
     # Transport
     "run_stdio",
     "run_http",
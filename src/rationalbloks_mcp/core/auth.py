@@ -12,20 +12,27 @@
 # - Caching for performance (per-session, not persistent)
 # ============================================================================
 
+import hashlib
+import os
 from typing import Any
 from starlette.requests import Request
 
+from .._keys import API_KEY_PREFIX, API_KEY_MIN_LENGTH
+
 # Public API
 __all__ = [
     "validate_api_key",
     "extract_api_key_from_request",
     "APIKeyCache",
+    "hash_api_key",
 ]
 
-# API key prefix - all RationalBloks keys start with this
-API_KEY_PREFIX = "rb_sk_"
 BEARER_PREFIX = "Bearer "
 
+# Per-process secret for cache-key hashing: digests are useless outside
+# this process and cannot be matched against a precomputed key list
+_PROCESS_SALT = os.urandom(16)
+
 
 def validate_api_key(api_key: str | None) -> tuple[bool, str | None]:
     # Validate API key format
@@ -41,7 +48,7 @@ def validate_api_key(api_key: str | None) -> tuple[bool, str | None]:
         return False, f"Invalid API key format - must start with '{API_KEY_PREFIX}'"
     
     # Minimum length check (prefix + at least 20 chars)
-    if len(api_key) < len(API_KEY_PREFIX) + 20:
+    if len(api_key) < API_KEY_MIN_LENGTH:
         return False, "API key is too short"
     
     return True, None
@@ -69,12 +76,18 @@ def extract_api_key_from_request(request: Request) -> str | None:
     return api_key
 
 
+def hash_api_key(api_key: str) -> str:
+    # Derive an in-memory cache key from an API key
+    # Keyed BLAKE2b-128: one C call, full 128 bits, no recoverable key prefix
+    return hashlib.blake2b(api_key.encode(), digest_size=16, key=_PROCESS_SALT).hexdigest()
+
+
 class APIKeyCache:
     # In-memory cache for validated API keys
     # Stores validation results to avoid repeated calls to auth server
     # Cache is per-server-instance (not persistent across restarts)
     # SECURITY:
-    # - Only stores key prefix (first 20 chars) as cache key
+    # - Only stores a keyed hash of the API key as cache key
     # - Full key never stored in cache
     # - Cache cleared on server restart
     
@@ -85,8 +98,7 @@ class APIKeyCache:
     
     def _get_cache_key(self, api_key: str) -> str:
         # Get cache key from API key (hash for security + collision avoidance)
-        import hashlib
-        return hashlib.sha256(api_key.encode()).hexdigest()[:32]
+        return hash_api_key(api_key)
     
     def get(self, api_key: str) -> dict[str, Any] | None:
         # Get cached user info for API key
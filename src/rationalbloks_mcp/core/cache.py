@@ -0,0 +1,103 @@
+# ============================================================================
+# RATIONALBLOKS MCP - RESPONSE CACHE
+# ============================================================================
+# Copyright 2026 RationalBloks. All Rights Reserved.
+#
+# In-process TTL cache for read-only tool results.
+# Lets repeated reads of slow-changing data (template catalogs, account
+# info) skip the gateway round-trip entirely.
+#
+# CHAIN MANTRA ENFORCEMENT:
+# - Opt-in per tool - only tools given an explicit TTL are ever cached
+# - Entries are scoped per API key - tenants never see each other's data
+# - Per-process only, never persisted
+# ============================================================================
+
+import json
+import time
+from collections import OrderedDict
+from typing import Any
+
+import orjson
+
+from .auth import hash_api_key
+
+# Public API
+__all__ = [
+    "ResponseCache",
+]
+
+
+class ResponseCache:
+    # TTL cache for tool results keyed by (API key, tool name, arguments)
+    # SECURITY:
+    # - API key is hashed before use in the cache key
+    # - Full key never stored in cache
+    
+    def __init__(self, max_size: int = 512) -> None:
+        # Initialize cache with maximum number of entries
+        # Kept in LRU order: hits move to the end, eviction pops the front
+        self._cache: OrderedDict[tuple[str, str, bytes], tuple[float, Any]] = OrderedDict()
+        self._max_size = max_size
+    
+    def _get_cache_key(
+        self,
+        api_key: str,
+        tool: str,
+        arguments: dict | None,
+    ) -> tuple[str, str, bytes]:
+        # Arguments may nest dicts/lists (unhashable) - canonical JSON bytes
+        # with sorted keys give a stable, hashable representation
+        # orjson rejects integers wider than 64 bits - stdlib json takes them
+        key_hash = hash_api_key(api_key)
+        try:
+            args = orjson.dumps(arguments or {}, option=orjson.OPT_SORT_KEYS)
+        except orjson.JSONEncodeError:
+            args = json.dumps(arguments or {}, sort_keys=True, separators=(",", ":")).encode()
+        return key_hash, tool, args
+    
+    def get(self, api_key: str, tool: str, arguments: dict | None) -> Any | None:
+        # Get cached result, or None if missing or expired
+        cache_key = self._get_cache_key(api_key, tool, arguments)
+        entry = self._cache.get(cache_key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._cache[cache_key]
+            return None
+        self._cache.move_to_end(cache_key)
+        return value
+    
+    def set(
+        self,
+        api_key: str,
+        tool: str,
+        arguments: dict | None,
+        value: Any,
+        ttl: float,
+    ) -> None:
+        # Cache a result for ttl seconds (None results are not cached)
+        if value is None:
+            return
+        cache_key = self._get_cache_key(api_key, tool, arguments)
+        if cache_key in self._cache:
+            # Overwrite in place - size is unchanged, nothing to evict
+            self._cache.move_to_end(cache_key)
+        elif len(self._cache) >= self._max_size:
+            # Drop the least recently used entry; expired entries are
+            # dropped lazily by get()
+            self._cache.popitem(last=False)
+        self._cache[cache_key] = (time.monotonic() + ttl, value)
+    
+    def invalidate(self, api_key: str, tool: str, arguments: dict | None) -> None:
+        # Drop one cached result (no-op if not cached)
+        self._cache.pop(self._get_cache_key(api_key, tool, arguments), None)
+    
+    def clear(self) -> None:
+        # Clear all cached entries
+        self._cache.clear()
+    
+    def __len__(self) -> int:
+        # Return number of cached entries
+        return len(self._cache)
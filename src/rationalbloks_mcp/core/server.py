@@ -15,6 +15,10 @@ import json
 import sys
 from typing import Any, Callable
 
+import orjson
+from jsonschema import ValidationError
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.server.lowlevel.server import NotificationOptions
@@ -217,17 +221,20 @@ class BaseMCPServer:
         version: str,
         instructions: str,
         api_key: str | None = None,
-        http_mode: bool = False,
+        transport: str = "stdio",
     ) -> None:
         # Initialize base MCP server
+        # transport: "stdio" for local IDEs or "http" for cloud
         # CHAIN: Validate API key first, fail immediately if invalid
         self.name = name
         self.version = version
         self.instructions = instructions
-        self.http_mode = http_mode
+        self.transport = transport
+        # Derived once here - the single source of truth for HTTP mode
+        self.http_mode = transport == "http"
 
         # Validate API key for STDIO mode
-        if not http_mode:
+        if not self.http_mode:
             is_valid, error = validate_api_key(api_key)
             if not is_valid:
                 raise ValueError(error)
@@ -235,14 +242,30 @@ class BaseMCPServer:
         else:
             self.api_key = None
         
+        # API key for the current request - the mode never changes, so the
+        # lookup is bound once here instead of branching on every tool call
+        self.get_api_key_for_request: Callable[[], str | None] = (
+            self._get_api_key_http if self.http_mode else self._get_api_key_stdio
+        )
+        
         # Create MCP server instance
         self.server = create_mcp_server(name, version, instructions)
         
         # Tools and handlers (set by subclass)
         self._tools: list[dict] = []
+        self._tool_names: frozenset[str] = frozenset()
         self._tool_handlers: dict[str, Callable] = {}
         self._prompts: list[Prompt] = []
         self._prompt_handlers: dict[str, Callable] = {}
+        # Built once by setup_handlers(): tools/list payload, compiled
+        # inputSchema validators
+        self._tool_objects: list[Tool] = []
+        self._input_validators: dict[str, Validator] = {}
+        # Set by setup_handlers() - the tool and prompt payloads are built
+        # then, so later registrations would silently never be listed. The
+        # register_* methods refuse to run after that, so the registries
+        # above are never mutated while requests are being served.
+        self._handlers_ready = False
         
         # Resources
         self._static_resources: dict[str, str] = {
@@ -250,21 +273,41 @@ class BaseMCPServer:
             "rationalbloks://docs/schema-reference": DOCS_SCHEMA_REFERENCE,
             "rationalbloks://docs/api-reference": DOCS_API_REFERENCE,
         }
+        
+        # The resource set is fixed - build the resources/list payload once
+        resources = []
+        for uri in self._static_resources:
+            title = uri.split("/")[-1].replace("-", " ").title()
+            resources.append(Resource(
+                uri=uri,
+                name=f"{title} Guide",
+                description=f"Documentation: {title}",
+                mimeType="text/markdown"
+            ))
+        self._resource_objects: list[Resource] = resources
     
     def register_tools(self, tools: list[dict]) -> None:
         # Register tools for this server mode
+        if self._handlers_ready:
+            raise RuntimeError("Cannot register tools after setup_handlers()")
         self._tools.extend(tools)
     
     def register_tool_handler(self, name: str, handler: Callable) -> None:
         # Register a handler function for a tool
+        if self._handlers_ready:
+            raise RuntimeError("Cannot register tool handlers after setup_handlers()")
         self._tool_handlers[name] = handler
     
     def register_prompts(self, prompts: list[Prompt]) -> None:
         # Register prompts for this server mode
+        if self._handlers_ready:
+            raise RuntimeError("Cannot register prompts after setup_handlers()")
         self._prompts.extend(prompts)
     
     def register_prompt_handler(self, name: str, handler: Callable) -> None:
         # Register a handler function for a prompt
+        if self._handlers_ready:
+            raise RuntimeError("Cannot register prompt handlers after setup_handlers()")
         self._prompt_handlers[name] = handler
     
     def setup_handlers(self) -> None:
@@ -273,40 +316,63 @@ class BaseMCPServer:
         self._setup_tool_handlers()
         self._setup_prompt_handlers()
         self._setup_resource_handlers()
+        
+        self._handlers_ready = True
     
     def _setup_tool_handlers(self) -> None:
         # Set up tool listing and execution handlers
+        # Tool names are fixed once handlers are set up - hash them once
+        # so call_tool does an O(1) membership check per invocation
+        self._tool_names = frozenset(t["name"] for t in self._tools)
+        
+        # Same for the tools/list payload: build the Tool models once instead
+        # of re-validating every tool definition on each listing request
+        tools_list = []
+        for tool in self._tools:
+            annotations = None
+            if "annotations" in tool:
+                ann = tool["annotations"]
+                annotations = ToolAnnotations(
+                    readOnlyHint=ann.get("readOnlyHint"),
+                    destructiveHint=ann.get("destructiveHint"),
+                    idempotentHint=ann.get("idempotentHint"),
+                    openWorldHint=ann.get("openWorldHint")
+                )
+            
+            tool_obj = Tool(
+                name=tool["name"],
+                title=tool.get("title"),
+                description=tool["description"],
+                inputSchema=tool["inputSchema"],
+                annotations=annotations
+            )
+            tools_list.append(tool_obj)
+        self._tool_objects = tools_list
+        
+        # Compile one validator per inputSchema up front. The SDK's default
+        # jsonschema.validate() re-checks the schema and rebuilds the
+        # validator on every call, so its built-in validation is disabled below
+        self._input_validators = {}
+        for tool in self._tools:
+            validator_cls = validator_for(tool["inputSchema"])
+            validator_cls.check_schema(tool["inputSchema"])
+            self._input_validators[tool["name"]] = validator_cls(tool["inputSchema"])
         
         @self.server.list_tools()
         async def list_tools() -> list[Tool]:
-            tools_list = []
-            for tool in self._tools:
-                annotations = None
-                if "annotations" in tool:
-                    ann = tool["annotations"]
-                    annotations = ToolAnnotations(
-                        readOnlyHint=ann.get("readOnlyHint"),
-                        destructiveHint=ann.get("destructiveHint"),
-                        idempotentHint=ann.get("idempotentHint"),
-                        openWorldHint=ann.get("openWorldHint")
-                    )
-                
-                tool_obj = Tool(
-                    name=tool["name"],
-                    title=tool.get("title"),
-                    description=tool["description"],
-                    inputSchema=tool["inputSchema"],
-                    annotations=annotations
-                )
-                tools_list.append(tool_obj)
-            return tools_list
+            return self._tool_objects
         
-        @self.server.call_tool()
+        @self.server.call_tool(validate_input=False)
         async def call_tool(name: str, arguments: dict) -> list[TextContent]:
-            valid_tools = [t["name"] for t in self._tools]
-            if name not in valid_tools:
+            if name not in self._tool_names:
                 raise ValueError(f"Unknown tool: {name}")
             
+            # Same error text the SDK's own input validation produces
+            try:
+                self._input_validators[name].validate(arguments)
+            except ValidationError as e:
+                raise ValueError(f"Input validation error: {e.message}") from e
+            
             # Check for specific handler first, then wildcard handler
             handler = self._tool_handlers.get(name) or self._tool_handlers.get("*")
             if not handler:
@@ -317,7 +383,17 @@ class BaseMCPServer:
             # (isError=True on CallToolResult). Silently returning "Error: ..."
             # text lets AI agents chain a next step after a failed tool call.
             result = await handler(name, arguments)
-            formatted = json.dumps(result, indent=2, default=str)
+            # orjson: C encoder, same indented output as json.dumps(indent=2)
+            # OPT_NON_STR_KEYS keeps json's int/float key stringification.
+            # It rejects integers wider than 64 bits - json renders those exactly
+            try:
+                formatted = orjson.dumps(
+                    result,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                ).decode()
+            except orjson.JSONEncodeError:
+                formatted = json.dumps(result, indent=2, default=str)
             return [TextContent(type="text", text=formatted)]
     
     def _setup_prompt_handlers(self) -> None:
@@ -339,16 +415,7 @@ class BaseMCPServer:
         
         @self.server.list_resources()
         async def list_resources() -> list[Resource]:
-            resources = []
-            for uri, _ in self._static_resources.items():
-                name = uri.split("/")[-1].replace("-", " ").title()
-                resources.append(Resource(
-                    uri=uri,
-                    name=f"{name} Guide",
-                    description=f"Documentation: {name}",
-                    mimeType="text/markdown"
-                ))
-            return resources
+            return self._resource_objects
         
         @self.server.read_resource()
         async def read_resource(uri) -> str:
@@ -357,14 +424,12 @@ class BaseMCPServer:
                 return self._static_resources[uri_str]
             raise ValueError(f"Unknown resource: {uri_str}")
     
-    def get_api_key_for_request(self) -> str | None:
-        # Get API key for current request
-        # STDIO mode: Returns stored API key
-        # HTTP mode: Extracts from Authorization header
-        if not self.http_mode:
-            return self.api_key
-        
-        # HTTP mode - extract from request
+    def _get_api_key_stdio(self) -> str | None:
+        # STDIO mode: the API key validated at startup
+        return self.api_key
+    
+    def _get_api_key_http(self) -> str | None:
+        # HTTP mode: extract from the request's Authorization header
         ctx = getattr(self.server, 'request_context', None)
         if ctx is None:
             return None
@@ -388,18 +453,25 @@ class BaseMCPServer:
             website_url="https://rationalbloks.com",
         )
     
-    def run(self, transport: str = "stdio") -> None:
-        # Run the MCP server with specified transport
-        # transport: "stdio" for local IDEs or "http" for cloud
-        if transport == "http":
+    async def close(self) -> None:
+        # Release resources held by the server (no-op by default)
+        # Subclasses holding pooled clients override this
+        # Called by the transport when the session/lifespan ends
+        return None
+    
+    def run(self) -> None:
+        # Run the MCP server with the transport chosen at construction
+        if self.http_mode:
             run_http(
                 server=self.server,
                 name=self.name,
                 version=self.version,
                 description=self.instructions,
+                on_shutdown=self.close,
             )
         else:
             run_stdio(
                 server=self.server,
                 init_options=self.get_init_options(),
+                on_shutdown=self.close,
             )
@@ -18,8 +18,9 @@ import contextlib
 import os
 import sys
 from typing import Any, Callable
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable
 
+import orjson
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.server.models import InitializationOptions
@@ -41,20 +42,28 @@ __all__ = [
 def run_stdio(
     server: Server,
     init_options: InitializationOptions,
+    on_shutdown: Callable[[], Awaitable[None]] | None = None,
 ) -> None:
     # Run MCP server in STDIO mode for local IDEs
     # Used by: Cursor, VS Code, Claude Desktop, Windsurf
+    # on_shutdown: awaited inside the event loop once the session ends
     # CHAIN: Single async run, no error branching
-    asyncio.run(_stdio_async(server, init_options))
+    asyncio.run(_stdio_async(server, init_options, on_shutdown))
 
 
 async def _stdio_async(
     server: Server,
     init_options: InitializationOptions,
+    on_shutdown: Callable[[], Awaitable[None]] | None = None,
 ) -> None:
     # Async STDIO handler with MCP stream management
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, init_options)
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, init_options)
+    finally:
+        # Release pooled resources (HTTP clients) on the loop that owns them
+        if on_shutdown:
+            await on_shutdown()
 
 
 # ============================================================================
@@ -67,21 +76,29 @@ def run_http(
     version: str,
     description: str,
     server_card_builder: Callable[[], dict] | None = None,
+    on_shutdown: Callable[[], Awaitable[None]] | None = None,
 ) -> None:
     # Run MCP server in HTTP mode for cloud deployment
     # Used by: Smithery, Replit, web agents, cloud platforms
+    # on_shutdown: awaited when the ASGI lifespan ends
     # CHAIN: Build app → run uvicorn → no branching
     import uvicorn
     
-    app = create_http_app(server, name, version, description, server_card_builder)
+    app = create_http_app(
+        server, name, version, description, server_card_builder, on_shutdown,
+    )
     
     port = int(os.environ.get("PORT", 8000))
     host = os.environ.get("HOST", "0.0.0.0")
     
-    print(f"[rationalbloks-mcp] HTTP server starting on {host}:{port}", file=sys.stderr)
-    print(f"[rationalbloks-mcp] MCP endpoints:", file=sys.stderr)
-    print(f"[rationalbloks-mcp]   - http://{host}:{port}/sse (primary)", file=sys.stderr)
-    print(f"[rationalbloks-mcp]   - http://{host}:{port}/mcp (alternative)", file=sys.stderr)
+    # One pre-joined write instead of a print per line
+    sys.stderr.write(
+        f"[rationalbloks-mcp] HTTP server starting on {host}:{port}\n"
+        f"[rationalbloks-mcp] MCP endpoints:\n"
+        f"[rationalbloks-mcp]   - http://{host}:{port}/sse (primary)\n"
+        f"[rationalbloks-mcp]   - http://{host}:{port}/mcp (alternative)\n"
+    )
+    sys.stderr.flush()
     
     uvicorn.run(app, host=host, port=port, log_level="info")
 
@@ -92,16 +109,17 @@ def create_http_app(
     version: str,
     description: str,
     server_card_builder: Callable[[], dict] | None = None,
+    on_shutdown: Callable[[], Awaitable[None]] | None = None,
 ) -> Any:
     # Create Starlette ASGI application for HTTP transport
     # Returns fully configured ASGI app with:
     # - Server card endpoint (/.well-known/mcp/server-card.json)
     # - Health check endpoint (/health)
-    # - MCP SSE endpoints (/sse, /mcp, /)
+    # - MCP endpoints (/sse, /mcp, / - all via the catch-all mount)
     # - CORS middleware for browser clients
     from starlette.applications import Starlette
     from starlette.routing import Route, Mount
-    from starlette.responses import JSONResponse
+    from starlette.responses import JSONResponse, Response
     from starlette.middleware.cors import CORSMiddleware
     from starlette.types import Receive, Scope, Send
     
@@ -112,17 +130,24 @@ def create_http_app(
         stateless=True,
     )
     
+    # The default card never changes for this app - encode it once
+    # (a custom builder is still called per request)
+    default_card_body = None
+    if not server_card_builder:
+        default_card_body = orjson.dumps(_build_default_server_card(name, version, description))
+    
     async def server_card(request):
         # MCP Server Card for Smithery discovery
         if server_card_builder:
-            card = server_card_builder()
-        else:
-            card = _build_default_server_card(name, version, description)
-        return JSONResponse(card)
+            return JSONResponse(server_card_builder())
+        return Response(default_card_body, media_type="application/json")
+    
+    # Probes hit this every few seconds and the body never changes
+    health_body = orjson.dumps({"status": "ok", "version": version})
     
     async def health(request):
         # Health check endpoint for Kubernetes probes
-        return JSONResponse({"status": "ok", "version": version})
+        return Response(health_body, media_type="application/json")
     
     async def handle_streamable(scope: Scope, receive: Receive, send: Send):
         # Handle Streamable HTTP requests for MCP protocol
@@ -131,8 +156,13 @@ def create_http_app(
     @contextlib.asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncIterator[None]:
         # Application lifespan for session manager
-        async with session_manager.run():
-            yield
+        try:
+            async with session_manager.run():
+                yield
+        finally:
+            # Release pooled resources (HTTP clients) on server shutdown
+            if on_shutdown:
+                await on_shutdown()
     
     # Build Starlette app
     app = Starlette(
@@ -140,8 +170,9 @@ def create_http_app(
         routes=[
             Route("/.well-known/mcp/server-card.json", endpoint=server_card, methods=["GET"]),
             Route("/health", endpoint=health, methods=["GET"]),
-            Mount("/sse", app=handle_streamable),
-            Mount("/mcp", app=handle_streamable),
+            # One catch-all mount serves /sse, /mcp and / alike - the
+            # session manager never looks at the path, so separate /sse
+            # and /mcp mounts were only extra route matches per request
             Mount("/", app=handle_streamable),
         ],
         lifespan=lifespan,
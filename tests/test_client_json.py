@@ -0,0 +1,59 @@
+# ============================================================================
+# RATIONALBLOKS MCP - LOGICBLOK CLIENT JSON TESTS
+# ============================================================================
+# Copyright 2026 RationalBloks. All Rights Reserved.
+#
+# Request and response bodies go through orjson for speed. orjson limits
+# integers to 64 bits, so values wider than that (user data, gateway ids)
+# must still round-trip exactly, as they did with stdlib json.
+# ============================================================================
+
+import json
+
+import httpx
+
+from rationalbloks_mcp.backend.client import LogicBlokClient
+
+BIG_INT = 97801234567890123456
+
+
+async def _execute(arguments: dict, reply: dict) -> tuple[dict, object]:
+    # Run one execute() call; return (request body sent, result returned)
+    sent = {}
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.update(json.loads(request.content))
+        return httpx.Response(200, json=reply)
+    
+    async with httpx.AsyncClient(
+        base_url=LogicBlokClient.BASE_URL, transport=httpx.MockTransport(handler)
+    ) as http_client:
+        client = LogicBlokClient("rb_sk_" + "a" * 24, http_client=http_client)
+        result = await client.execute("create_graph_node", arguments)
+    return sent, result
+
+
+async def test_wide_integer_argument_sent_exactly():
+    arguments = {"project_id": "p1", "data": {"isbn": BIG_INT}}
+    sent, _ = await _execute(arguments, {"success": True, "result": {}})
+    assert sent == {"tool": "create_graph_node", "arguments": arguments}
+
+
+async def test_regular_arguments_sent_unchanged():
+    arguments = {"project_id": "p1", "data": {"n": 2 ** 63 - 1, "name": "\u00e9"}}
+    sent, _ = await _execute(arguments, {"success": True, "result": {}})
+    assert sent["arguments"] == arguments
+
+
+async def test_wide_integer_result_kept_exact():
+    reply = {"success": True, "result": {"id": 123456789012345678901234, "min": -(2 ** 63) - 1}}
+    _, result = await _execute({"project_id": "p1"}, reply)
+    assert result == reply["result"]
+    assert isinstance(result["id"], int)
+    assert isinstance(result["min"], int)
+
+
+async def test_regular_result_unchanged():
+    reply = {"success": True, "result": {"n": 2 ** 63 - 1, "x": 1.5, "s": "12345678901234567890"}}
+    _, result = await _execute({"project_id": "p1"}, reply)
+    assert result == reply["result"]
@@ -0,0 +1,72 @@
+# ============================================================================
+# RATIONALBLOKS MCP - PER-KEY CLIENT POOL TESTS
+# ============================================================================
+# Copyright 2026 RationalBloks. All Rights Reserved.
+#
+# BackendMCPServer keeps one LogicBlokClient per API key, LRU-ordered and
+# capped at MAX_POOLED_CLIENTS. Every pooled client shares the server's one
+# httpx pool, so evicting a client must never close that pool.
+# ============================================================================
+
+from typing import AsyncIterator
+
+import pytest
+
+from rationalbloks_mcp.backend import tools as backend_tools
+from rationalbloks_mcp.backend.tools import BackendMCPServer, create_backend_server
+
+
+def _key(name: str) -> str:
+    return "rb_sk_" + name * 24
+
+
+@pytest.fixture
+async def server(monkeypatch) -> AsyncIterator[BackendMCPServer]:
+    monkeypatch.setattr(backend_tools, "MAX_POOLED_CLIENTS", 2)
+    server = create_backend_server(api_key=_key("a"))
+    yield server
+    await server.close()
+
+
+async def _client_for(server: BackendMCPServer, name: str):
+    server.get_api_key_for_request = lambda: _key(name)
+    return await server._get_client()
+
+
+async def test_same_key_reuses_client(server):
+    first = await _client_for(server, "a")
+    assert await _client_for(server, "a") is first
+    assert len(server._clients) == 1
+
+
+async def test_evicts_least_recently_used_at_cap(server):
+    await _client_for(server, "a")
+    await _client_for(server, "b")
+    await _client_for(server, "c")
+    assert list(server._clients) == [_key("b"), _key("c")]
+
+
+async def test_hit_refreshes_recency(server):
+    a = await _client_for(server, "a")
+    await _client_for(server, "b")
+    assert await _client_for(server, "a") is a
+    await _client_for(server, "c")
+    assert list(server._clients) == [_key("a"), _key("c")]
+
+
+async def test_eviction_keeps_shared_http_client_open(server):
+    evicted = await _client_for(server, "a")
+    await _client_for(server, "b")
+    await _client_for(server, "c")
+    assert _key("a") not in server._clients
+    assert evicted._client is server._http_client
+    assert not server._http_client.is_closed
+    # The surviving clients still work on the shared pool
+    assert (await _client_for(server, "b"))._client is server._http_client
+
+
+async def test_close_closes_shared_http_client(server):
+    await _client_for(server, "a")
+    await server.close()
+    assert server._clients == {}
+    assert server._http_client.is_closed
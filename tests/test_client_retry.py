@@ -0,0 +1,122 @@
+# ============================================================================
+# RATIONALBLOKS MCP - LOGICBLOK CLIENT RETRY TESTS
+# ============================================================================
+# Copyright 2026 RationalBloks. All Rights Reserved.
+#
+# Retry policy of LogicBlokClient: which calls may be resent at all, and
+# Retry-After handling in _retry_delay. The header comes from the gateway or
+# any proxy in front of it, so malformed values must never crash or hang a
+# tool call. Writes must not be resent on a bare 503.
+# ============================================================================
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from typing import AsyncIterator
+
+import httpx
+import pytest
+
+from rationalbloks_mcp.backend.client import LogicBlokClient
+
+
+@pytest.fixture
+async def client() -> AsyncIterator[LogicBlokClient]:
+    async with httpx.AsyncClient() as http_client:
+        yield LogicBlokClient("rb_sk_" + "a" * 24, http_client=http_client)
+
+
+def _response(retry_after: str | None = None) -> httpx.Response:
+    headers = {} if retry_after is None else {"Retry-After": retry_after}
+    return httpx.Response(503, headers=headers)
+
+
+def _in(seconds: float) -> datetime:
+    return datetime.now(timezone.utc) + timedelta(seconds=seconds)
+
+
+def _assert_backoff(client: LogicBlokClient, delay: float | None, attempt: int) -> None:
+    assert delay is not None
+    assert 0.0 <= delay <= min(client.MAX_RETRY_DELAY, client.RETRY_DELAY * (2 ** attempt))
+
+
+@pytest.mark.parametrize("value, expected", [("5", 5.0), ("0", 0.0), ("2.5", 2.5), ("-3", 0.0)])
+async def test_delta_seconds(client, value, expected):
+    assert client._retry_delay(_response(value), 0) == expected
+
+
+async def test_http_date_gmt(client):
+    delay = client._retry_delay(_response(format_datetime(_in(10), usegmt=True)), 0)
+    assert 8.0 <= delay <= 10.0
+
+
+async def test_http_date_minus_zero_zone_is_utc(client):
+    # "-0000" parses to a naive datetime - must not raise TypeError
+    value = _in(10).strftime("%a, %d %b %Y %H:%M:%S -0000")
+    delay = client._retry_delay(_response(value), 0)
+    assert 8.0 <= delay <= 10.0
+
+
+async def test_http_date_in_past(client):
+    assert client._retry_delay(_response(format_datetime(_in(-60), usegmt=True)), 0) == 0.0
+
+
+@pytest.mark.parametrize("value", [None, "soon", "", "Wed, 99 Foo 2035"])
+async def test_missing_or_garbage_falls_back_to_backoff(client, value):
+    _assert_backoff(client, client._retry_delay(_response(value), 2), 2)
+
+
+@pytest.mark.parametrize("value", ["nan", "inf", "-inf", "NaN"])
+async def test_non_finite_falls_back_to_backoff(client, value):
+    _assert_backoff(client, client._retry_delay(_response(value), 1), 1)
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["120", "Wed, 21 Oct 2035 07:28:00 GMT", "Wed, 21 Oct 2035 07:28:00 -0000"],
+)
+async def test_over_cap_gives_up(client, value):
+    assert client._retry_delay(_response(value), 0) is None
+
+
+async def _run_execute(statuses: list[tuple[int, dict]], idempotent: bool) -> tuple[int, list[int]]:
+    # Replay the given (status, headers) sequence; return (final status, sent statuses)
+    seen = []
+    replies = iter(statuses)
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        status, headers = next(replies)
+        seen.append(status)
+        if status == 200:
+            return httpx.Response(200, json={"success": True, "result": "ok"})
+        return httpx.Response(status, headers=headers)
+    
+    async with httpx.AsyncClient(
+        base_url=LogicBlokClient.BASE_URL, transport=httpx.MockTransport(handler)
+    ) as http_client:
+        client = LogicBlokClient("rb_sk_" + "a" * 24, http_client=http_client)
+        try:
+            await client.execute("create_project", {"name": "x"}, idempotent=idempotent)
+            status = 200
+        except httpx.HTTPStatusError as e:
+            status = e.response.status_code
+    return status, seen
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(LogicBlokClient, "RETRY_DELAY", 0.0)
+
+
+async def test_idempotent_call_retries_plain_503(no_sleep):
+    assert await _run_execute([(503, {}), (200, {})], idempotent=True) == (200, [503, 200])
+
+
+async def test_write_call_does_not_retry_plain_503(no_sleep):
+    # The gateway may already have acted - resending could duplicate a write
+    assert await _run_execute([(503, {}), (200, {})], idempotent=False) == (503, [503])
+
+
+async def test_write_call_retries_explicit_load_shedding(no_sleep):
+    replies = [(429, {}), (503, {"Retry-After": "0"}), (200, {})]
+    assert await _run_execute(replies, idempotent=False) == (200, [429, 503, 200])
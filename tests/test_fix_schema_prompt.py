@@ -0,0 +1,53 @@
+# ============================================================================
+# RATIONALBLOKS MCP - FIX-SCHEMA PROMPT TESTS
+# ============================================================================
+# Copyright 2026 RationalBloks. All Rights Reserved.
+#
+# The fix-schema-errors prompt lints the submitted schema and lists what it
+# finds. Input that is not a JSON schema keeps the plain checklist.
+# ============================================================================
+
+import json
+
+import pytest
+
+from rationalbloks_mcp.backend.tools import create_backend_server
+
+
+def _prompt_text(schema: str) -> str:
+    server = create_backend_server(api_key="rb_sk_" + "a" * 24)
+    result = server._handle_fix_schema_prompt(
+        "fix-schema-errors", {"schema": schema, "error_message": "deploy failed"}
+    )
+    return result.messages[0].content.text
+
+
+def test_lists_detected_violations():
+    schema = json.dumps({
+        "books": {
+            "id": {"type": "uuid"},
+            "title": {"type": "string"},
+            "published_at": {"type": "timestamp"},
+        },
+    })
+    text = _prompt_text(schema)
+    assert (
+        "Detected violations:\n"
+        "- books.title: string fields MUST have max_length\n"
+        "- books.published_at: use 'datetime' instead of 'timestamp'\n"
+        "- books.id: automatic field - do not define it\n\n"
+    ) in text
+    assert schema in text
+    assert "Error: deploy failed" in text
+
+
+def test_valid_schema_has_no_detected_section():
+    schema = json.dumps({"books": {"title": {"type": "string", "max_length": 200}}})
+    assert "Detected violations" not in _prompt_text(schema)
+
+
+@pytest.mark.parametrize("schema", ["null", "not json", "{'books': {}}", ""])
+def test_skipped_for_null_or_non_json(schema):
+    text = _prompt_text(schema)
+    assert "Detected violations" not in text
+    assert f"Schema:\n{schema}\n" in text
@@ -0,0 +1,73 @@
+# ============================================================================
+# RATIONALBLOKS MCP - JOB STATUS CACHE TESTS
+# ============================================================================
+# Copyright 2026 RationalBloks. All Rights Reserved.
+#
+# get_job_status goes through the read cache: a running job is re-fetched
+# after READ_CACHE_TTLS["get_job_status"] (2s) so polling sees progress,
+# while a terminal status never changes and is kept for JOB_TERMINAL_TTL.
+# ============================================================================
+
+from types import SimpleNamespace
+
+import pytest
+
+from rationalbloks_mcp.backend import tools as backend_tools
+from rationalbloks_mcp.backend.tools import (
+    JOB_TERMINAL_TTL,
+    READ_CACHE_TTLS,
+    create_backend_server,
+)
+from rationalbloks_mcp.core import cache as cache_module
+
+ARGUMENTS = {"job_id": "job-1"}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # Fake monotonic clock for the cache only (asyncio keeps the real one)
+    now = [1000.0]
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+@pytest.fixture
+def gateway(monkeypatch):
+    # Replies with the current job status; records every gateway call
+    state = SimpleNamespace(status="running", calls=0)
+    
+    async def fake_execute(self, tool, arguments=None, idempotent=False):
+        state.calls += 1
+        return {"job_id": arguments["job_id"], "status": state.status}
+    
+    monkeypatch.setattr(backend_tools.LogicBlokClient, "execute", fake_execute)
+    return state
+
+
+def test_ttls():
+    assert READ_CACHE_TTLS["get_job_status"] == 2.0
+    assert JOB_TERMINAL_TTL == 600.0
+
+
+async def test_running_job_expires_after_2s(clock, gateway):
+    server = create_backend_server(api_key="rb_sk_" + "a" * 24)
+    await server._handle_backend_tool("get_job_status", ARGUMENTS)
+    clock[0] += 1.9
+    await server._handle_backend_tool("get_job_status", ARGUMENTS)
+    assert gateway.calls == 1
+    clock[0] += 0.1
+    await server._handle_backend_tool("get_job_status", ARGUMENTS)
+    assert gateway.calls == 2
+
+
+@pytest.mark.parametrize("status", ["completed", "failed"])
+async def test_terminal_job_cached_for_600s(clock, gateway, status):
+    server = create_backend_server(api_key="rb_sk_" + "a" * 24)
+    gateway.status = status
+    result = await server._handle_backend_tool("get_job_status", ARGUMENTS)
+    clock[0] += 599.0
+    assert await server._handle_backend_tool("get_job_status", ARGUMENTS) == result
+    assert gateway.calls == 1
+    clock[0] += 1.0
+    await server._handle_backend_tool("get_job_status", ARGUMENTS)
+    assert gateway.calls == 2
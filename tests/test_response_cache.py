@@ -0,0 +1,50 @@
+# ============================================================================
+# RATIONALBLOKS MCP - RESPONSE CACHE TESTS
+# ============================================================================
+# Copyright 2026 RationalBloks. All Rights Reserved.
+#
+# Size bound and LRU order of ResponseCache: overwriting a cached key must
+# not evict anything, and a full cache drops only its least recently used
+# entry.
+# ============================================================================
+
+from rationalbloks_mcp.core.cache import ResponseCache
+
+API_KEY = "rb_sk_" + "x" * 32
+
+
+def test_overwrite_at_capacity_keeps_other_entries():
+    cache = ResponseCache(max_size=2)
+    cache.set(API_KEY, "a", None, 1, ttl=60)
+    cache.set(API_KEY, "b", None, 2, ttl=60)
+    cache.set(API_KEY, "b", None, 3, ttl=60)
+    assert len(cache) == 2
+    assert cache.get(API_KEY, "a", None) == 1
+    assert cache.get(API_KEY, "b", None) == 3
+
+
+def test_full_cache_evicts_least_recently_used():
+    cache = ResponseCache(max_size=2)
+    cache.set(API_KEY, "a", None, 1, ttl=60)
+    cache.set(API_KEY, "b", None, 2, ttl=60)
+    cache.get(API_KEY, "a", None)
+    cache.set(API_KEY, "c", None, 3, ttl=60)
+    assert len(cache) == 2
+    assert cache.get(API_KEY, "b", None) is None
+    assert cache.get(API_KEY, "a", None) == 1
+    assert cache.get(API_KEY, "c", None) == 3
+
+
+def test_wide_integer_arguments_are_cacheable():
+    cache = ResponseCache(max_size=2)
+    args = {"project_id": "p1", "node_id": 97801234567890123456}
+    cache.set(API_KEY, "a", args, 1, ttl=60)
+    assert cache.get(API_KEY, "a", dict(args)) == 1
+    assert cache.get(API_KEY, "a", {**args, "node_id": args["node_id"] + 1}) is None
+
+
+def test_expired_entry_dropped_on_get():
+    cache = ResponseCache(max_size=2)
+    cache.set(API_KEY, "a", None, 1, ttl=0)
+    assert cache.get(API_KEY, "a", None) is None
+    assert len(cache) == 0
@@ -0,0 +1,130 @@
+# ============================================================================
+# RATIONALBLOKS MCP - SCHEMA PRE-FLIGHT VALIDATION TESTS
+# ============================================================================
+# Copyright 2026 RationalBloks. All Rights Reserved.
+#
+# The FLAT-format pre-flight rejects create_project / update_schema calls
+# before they reach the gateway. A false positive blocks a legitimate
+# deployment, so valid schemas must pass through untouched.
+# ============================================================================
+
+import copy
+
+import pytest
+
+from rationalbloks_mcp.backend import tools as backend_tools
+from rationalbloks_mcp.backend.schema_validate import (
+    find_schema_violations,
+    validate_flat_schema,
+)
+from rationalbloks_mcp.backend.tools import create_backend_server
+
+VALID_SCHEMA = {
+    "books": {
+        "title": {"type": "string", "max_length": 200, "required": True},
+        "price": {"type": "decimal", "precision": 10, "scale": 2},
+        "published_at": {"type": "datetime"},
+        "pages": {"type": "integer"},
+        "in_print": {"type": "boolean", "default": True},
+        "user_id": {"type": "uuid", "foreign_key": "app_users.id"},
+        # A real column called "fields" is not the nested format
+        "fields": {"type": "json"},
+    },
+    "tags": {
+        "label": {"type": "string", "max_length": 50},
+    },
+}
+
+
+def test_valid_schema_has_no_violations():
+    assert find_schema_violations(VALID_SCHEMA) == []
+
+
+def test_valid_schema_passes_unchanged():
+    schema = copy.deepcopy(VALID_SCHEMA)
+    assert validate_flat_schema(schema) is None
+    assert schema == VALID_SCHEMA
+
+
+@pytest.mark.parametrize("schema, message", [
+    (
+        {"books": {"fields": {"title": {"type": "string", "max_length": 10}}}},
+        "books: fields are nested under 'fields'",
+    ),
+    ({"books": {"title": {"max_length": 10}}}, "books.title: missing 'type' property"),
+    ({"books": {"title": "string"}}, "books.title: missing 'type' property"),
+    ({"books": {"title": {"type": "string"}}}, "books.title: string fields MUST have max_length"),
+    (
+        {"books": {"price": {"type": "decimal", "precision": 10}}},
+        "books.price: decimal fields MUST have precision and scale",
+    ),
+    (
+        {"books": {"price": {"type": "decimal", "scale": 2}}},
+        "books.price: decimal fields MUST have precision and scale",
+    ),
+    (
+        {"books": {"published_at": {"type": "timestamp"}}},
+        "books.published_at: use 'datetime' instead of 'timestamp'",
+    ),
+    ({"books": ["title"]}, "books: table must map field names to field definitions"),
+])
+def test_each_rule(schema, message):
+    violations = find_schema_violations(schema)
+    assert len(violations) == 1
+    assert violations[0].startswith(message)
+
+
+@pytest.mark.parametrize("schema", [None, "books", ["books"], 42])
+def test_non_dict_schema(schema):
+    assert find_schema_violations(schema) == [
+        "schema must be an object mapping table names to fields"
+    ]
+
+
+def test_error_lists_every_violation():
+    schema = {
+        "books": {
+            "title": {"type": "string"},
+            "price": {"type": "decimal"},
+            "published_at": {"type": "timestamp"},
+        },
+        "authors": {"name": {}},
+    }
+    with pytest.raises(ValueError) as exc_info:
+        validate_flat_schema(schema)
+    assert str(exc_info.value) == (
+        "Schema validation failed:\n"
+        "- books.title: string fields MUST have max_length\n"
+        "- books.price: decimal fields MUST have precision and scale\n"
+        "- books.published_at: use 'datetime' instead of 'timestamp'\n"
+        "- authors.name: missing 'type' property"
+    )
+
+
+@pytest.fixture
+def gateway_calls(monkeypatch):
+    calls = []
+    
+    async def fake_execute(self, tool, arguments=None, idempotent=False):
+        calls.append((tool, copy.deepcopy(arguments)))
+        return {"status": "queued"}
+    
+    monkeypatch.setattr(backend_tools.LogicBlokClient, "execute", fake_execute)
+    return calls
+
+
+@pytest.mark.parametrize("tool", ["create_project", "update_schema"])
+async def test_invalid_schema_never_reaches_gateway(gateway_calls, tool):
+    server = create_backend_server(api_key="rb_sk_" + "a" * 24)
+    arguments = {"project_id": "p1", "schema": {"books": {"title": {"type": "string"}}}}
+    with pytest.raises(ValueError, match="max_length"):
+        await server._handle_backend_tool(tool, arguments)
+    assert gateway_calls == []
+
+
+@pytest.mark.parametrize("tool", ["create_project", "update_schema"])
+async def test_valid_schema_sent_unchanged(gateway_calls, tool):
+    server = create_backend_server(api_key="rb_sk_" + "a" * 24)
+    arguments = {"project_id": "p1", "schema": copy.deepcopy(VALID_SCHEMA)}
+    await server._handle_backend_tool(tool, arguments)
+    assert gateway_calls == [(tool, {"project_id": "p1", "schema": VALID_SCHEMA})]
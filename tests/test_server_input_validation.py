@@ -0,0 +1,60 @@
+# ============================================================================
+# RATIONALBLOKS MCP - TOOL INPUT VALIDATION TESTS
+# ============================================================================
+# Copyright 2026 RationalBloks. All Rights Reserved.
+#
+# call_tool validates arguments with the validators precompiled in
+# _input_validators (the SDK's own per-call validation is disabled). Invalid
+# input must fail with the SDK's error text and never reach a handler.
+# ============================================================================
+
+import pytest
+from mcp.types import CallToolRequest, CallToolRequestParams
+
+from rationalbloks_mcp.backend import tools as backend_tools
+from rationalbloks_mcp.backend.tools import create_backend_server
+
+
+@pytest.fixture
+def server():
+    return create_backend_server(api_key="rb_sk_" + "a" * 24)
+
+
+async def _call(server, name: str, arguments: dict):
+    handler = server.server.request_handlers[CallToolRequest]
+    request = CallToolRequest(
+        method="tools/call",
+        params=CallToolRequestParams(name=name, arguments=arguments),
+    )
+    return (await handler(request)).root
+
+
+def test_validator_compiled_per_tool(server):
+    assert set(server._input_validators) == {t["name"] for t in server._tools}
+
+
+@pytest.mark.parametrize("arguments, message", [
+    ({}, "'project_id' is a required property"),
+    ({"project_id": 42}, "42 is not of type 'string'"),
+])
+async def test_invalid_arguments_rejected(server, monkeypatch, arguments, message):
+    calls = []
+    
+    async def fake_execute(self, tool, arguments=None, idempotent=False):
+        calls.append(tool)
+        return {}
+    
+    monkeypatch.setattr(backend_tools.LogicBlokClient, "execute", fake_execute)
+    result = await _call(server, "get_project", arguments)
+    assert result.isError
+    assert result.content[0].text == f"Input validation error: {message}"
+    assert calls == []
+
+
+async def test_valid_arguments_reach_handler(server, monkeypatch):
+    async def fake_execute(self, tool, arguments=None, idempotent=False):
+        return {"tool": tool}
+    
+    monkeypatch.setattr(backend_tools.LogicBlokClient, "execute", fake_execute)
+    result = await _call(server, "get_project", {"project_id": "p1"})
+    assert not result.isError
@@ -0,0 +1,44 @@
+# ============================================================================
+# RATIONALBLOKS MCP - TOOL RESULT FORMATTING TESTS
+# ============================================================================
+# Copyright 2026 RationalBloks. All Rights Reserved.
+#
+# call_tool renders handler results as indented JSON text with orjson.
+# Results orjson cannot encode (integers wider than 64 bits) must still be
+# rendered exactly, as with stdlib json.
+# ============================================================================
+
+import json
+
+from mcp.types import CallToolRequest, CallToolRequestParams
+
+from rationalbloks_mcp.backend import tools as backend_tools
+from rationalbloks_mcp.backend.tools import create_backend_server
+
+
+async def _call_with_result(monkeypatch, result):
+    async def fake_execute(self, tool, arguments=None, idempotent=False):
+        return result
+    
+    monkeypatch.setattr(backend_tools.LogicBlokClient, "execute", fake_execute)
+    server = create_backend_server(api_key="rb_sk_" + "a" * 24)
+    handler = server.server.request_handlers[CallToolRequest]
+    request = CallToolRequest(
+        method="tools/call",
+        params=CallToolRequestParams(name="get_project", arguments={"project_id": "p1"}),
+    )
+    return (await handler(request)).root
+
+
+async def test_result_rendered_as_indented_json(monkeypatch):
+    result = {"id": "p1", "count": 3, "tags": ["a"]}
+    root = await _call_with_result(monkeypatch, result)
+    assert not root.isError
+    assert root.content[0].text == json.dumps(result, indent=2)
+
+
+async def test_wide_integer_result_rendered_exactly(monkeypatch):
+    result = {"id": 123456789012345678901234}
+    root = await _call_with_result(monkeypatch, result)
+    assert not root.isError
+    assert root.content[0].text == json.dumps(result, indent=2)